@@ -85,6 +85,8 @@ class EVTripRuntimeData:
     emhass_adapter: Any = None
     # T3.1: Timer handle for hourly refresh — must be cancelled on unload to prevent EC-001 leak
     hourly_refresh_cancel: Callable[[], None] | None = None
+    # Remover for the TripManager change listener that pushes coordinator refreshes
+    trips_listener_cancel: Callable[[], None] | None = None
 
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
@@ -284,10 +286,15 @@ async def async_setup_entry(
     # Store runtime data using entry.runtime_data (HA-recommended pattern)
     # Must be assigned BEFORE publish_deferrable_loads so that the publish path
     # can safely access entry.runtime_data without a None race condition.
+    # Push model: coordinator has no polling interval, trip saves drive refreshes
+    trips_listener_cancel = trip_manager.register_listener(
+        coordinator.async_handle_trips_changed
+    )
     entry.runtime_data = EVTripRuntimeData(  # pragma: no cover reason=HA lifecycle — runtime data assignment during config entry setup
         coordinator=coordinator,
         trip_manager=trip_manager,
         emhass_adapter=emhass_adapter,
+        trips_listener_cancel=trips_listener_cancel,
     )
 
     # Now that coordinator and runtime_data are ready, publish loaded trips to EMHASS.
@@ -324,9 +331,13 @@ async def async_setup_entry(
         timedelta(hours=1),
     )
 
-    register_services(
-        hass
-    )  # pragma: no cover reason=HA lifecycle — service registration during entry setup
+    # Services are domain-wide: register them with the first entry only
+    if not hass.services.has_service(
+        DOMAIN, "add_recurring_trip"
+    ):  # pragma: no cover reason=HA lifecycle — service registration during entry setup
+        register_services(
+            hass
+        )  # pragma: no cover reason=HA lifecycle — service registration during entry setup
     await hass.config_entries.async_forward_entry_setups(
         entry, PLATFORMS
     )  # pragma: no cover reason=HA lifecycle — platform forwarding during entry setup
@@ -351,6 +362,11 @@ async def async_unload_entry(
         _LOGGER.debug(
             "Cancelled hourly refresh timer for vehicle %s", entry.entry_id
         )  # pragma: no cover reason=HA lifecycle — debug log during entry unload
+    # Detach the trip change listener so cascade deletion below does not
+    # schedule refreshes on a coordinator that is being torn down.
+    if runtime_data and getattr(runtime_data, "trips_listener_cancel", None):
+        runtime_data.trips_listener_cancel()
+        runtime_data.trips_listener_cancel = None
 
     vehicle_name_raw = entry.data.get("vehicle_name") or ""
     vehicle_id = normalize_vehicle_id(vehicle_name_raw)
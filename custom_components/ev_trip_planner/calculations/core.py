@@ -10,13 +10,13 @@ More sub-modules will be created as the decomposition progresses.
 from __future__ import annotations
 
 import unicodedata
-from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 from custom_components.ev_trip_planner.const import (
-    DAYS_OF_WEEK,
+    DAY_INDEX,
+    DAYS_OF_WEEK,  # noqa: F401  # re-exported by calculations/__init__.py
     DEFAULT_BATTERY_CAPACITY_KWH,
     DEFAULT_SOC_BASE,
     DEFAULT_T_BASE,
@@ -191,12 +191,8 @@ def calculate_day_index(day_name: str) -> int:
             return (js_day - 1) % 7
         return 0  # Monday on invalid index
 
-    # Try direct match first
-    with suppress(ValueError):
-        return DAYS_OF_WEEK.index(day_norm)
-
-    # If still not found, default to Monday (index 0)
-    return 0
+    # Day name lookup; default to Monday (index 0) if not found
+    return DAY_INDEX.get(day_norm, 0)
 
 
 # =============================================================================
@@ -155,7 +155,9 @@ def calculate_power_profile_from_trips(  # pragma: no mutate  # EQ-054
             charging_power_watts,
         )
 
-    _LOGGER.debug(_LOG_PROFILE_NON_ZERO, sum(1 for x in power_profile if x > 0))
+    # Counting non-zero slots walks the whole horizon; only pay for it at DEBUG
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(_LOG_PROFILE_NON_ZERO, sum(1 for x in power_profile if x > 0))
     return power_profile
 
 
@@ -5,7 +5,6 @@ Extracted to reduce EVTripPlannerFlowHandler LOC count and nesting depth.
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 from dataclasses import dataclass
@@ -13,6 +12,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 from ..const import (
     CONF_MAX_DEFERRABLE_LOADS,
@@ -52,9 +52,8 @@ def read_emhass_config(emhass_config_path: str) -> Optional[Dict[str, Any]]:
     except OSError:
         return None
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        return json_loads(Path(config_path).read_bytes())
+    except (*JSON_DECODE_EXCEPTIONS, OSError):
         return None
 
 
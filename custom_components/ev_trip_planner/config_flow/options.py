@@ -36,6 +36,20 @@ _LOGGER = logging.getLogger(__name__)
 
 _LOG_DEBUG_OPTIONS_INIT = "Options flow step init: showing form"
 
+# Value validators for the options form. Only the defaults depend on the
+# entry, so these are shared instead of rebuilt on every form render.
+_COERCE_FLOAT = vol.Coerce(float)
+_COERCE_INT = vol.Coerce(int)
+_T_BASE_VALIDATOR = vol.All(
+    vol.Coerce(float), vol.Range(min=MIN_T_BASE, max=MAX_T_BASE)
+)
+_SOH_SENSOR_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(
+        domain="sensor",
+        multiple=False,
+    )
+)
+
 # ---------------------------------------------------------------------------
 # EVTripPlannerOptionsFlowHandler
 # ---------------------------------------------------------------------------
@@ -105,18 +119,18 @@ class EVTripPlannerOptionsFlowHandler(config_entries.OptionsFlow):
                 {
                     vol.Required(
                         CONF_BATTERY_CAPACITY, default=current_battery
-                    ): vol.Coerce(float),
+                    ): _COERCE_FLOAT,
                     vol.Required(
                         CONF_CHARGING_POWER, default=current_charging
-                    ): vol.Coerce(float),
+                    ): _COERCE_FLOAT,
                     vol.Required(
                         CONF_CONSUMPTION,
                         default=current_consumption,
                         description="Consumo en tiempo real (kWh/km) + fallback manual",
-                    ): vol.Coerce(float),
+                    ): _COERCE_FLOAT,
                     vol.Required(
                         CONF_SAFETY_MARGIN, default=current_safety
-                    ): vol.Coerce(int),
+                    ): _COERCE_INT,
                     vol.Required(
                         CONF_T_BASE,
                         default=current_t_base,
@@ -129,17 +143,10 @@ class EVTripPlannerOptionsFlowHandler(config_entries.OptionsFlow):
                                 "Rango: 6-48h. Ejemplo: 24 (balance entre protección y flexibilidad)"
                             ),
                         },
-                    ): vol.All(
-                        vol.Coerce(float), vol.Range(min=MIN_T_BASE, max=MAX_T_BASE)
-                    ),
+                    ): _T_BASE_VALIDATOR,
                     vol.Optional(
                         CONF_SOH_SENSOR, default=current_soh
-                    ): selector.EntitySelector(
-                        selector.EntitySelectorConfig(
-                            domain="sensor",
-                            multiple=False,
-                        )
-                    ),
+                    ): _SOH_SENSOR_SELECTOR,
                 }
             ),
         )  # type: ignore[return-value]
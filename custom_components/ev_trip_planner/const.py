@@ -4,7 +4,7 @@ This module defines all configuration keys, default values, and enum constants
 used by the EV Trip Planner custom component. Key dependencies:
 - Home Assistant core (for sensor/entity management)
 - EMHASS integration (for energy-aware trip planning)
-- Spanish-language localization (via DAYS_OF_WEEK array)
+- Spanish-language localization (via DAYS_OF_WEEK tuple)
 
 Note: All CONF_* keys are used in the config flow and entity configuration.
 Default values are optimized for typical EV/PHEV usage patterns.
@@ -115,7 +115,7 @@ TRIP_STATUS_COMPLETED = "completado"
 TRIP_STATUS_CANCELLED = "cancelado"
 
 # Days of week (Spanish as base for localization)
-DAYS_OF_WEEK = [
+DAYS_OF_WEEK: tuple[str, ...] = (
     "lunes",
     "martes",
     "miercoles",
@@ -123,7 +123,9 @@ DAYS_OF_WEEK = [
     "viernes",
     "sabado",
     "domingo",
-]
+)
+# Reverse lookup: day name -> weekday index (0=lunes)
+DAY_INDEX: dict[str, int] = {day: i for i, day in enumerate(DAYS_OF_WEEK)}
 
 # TripEmhassSensor documented attribute keys
 # Prevents data leak of internal cache keys (activo, *_array, p_deferrable_matrix, etc.)
@@ -10,12 +10,16 @@ Phase 3: EMHASS keys are populated from emhass_adapter computation results.
 
 import logging
 from dataclasses import dataclass
-from datetime import timedelta
-from typing import Any
+from datetime import datetime, time, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_VEHICLE_NAME,
@@ -26,9 +30,6 @@ from .trip import TripManager
 
 _LOGGER = logging.getLogger(__name__)
 
-# qg-accepted: AP05 — standard polling interval for trip planning (2min > HA default 30s)
-UPDATE_INTERVAL_SECONDS = 120
-
 # E2E-DEBUG-CRITICAL: Log string constants — extracted for testability
 # Mutations on these strings are testable via assert on the constant values.
 _LOG_UPDATE_DATA_CALLED = (
@@ -46,6 +47,23 @@ _LOG_REFRESH_TRIPS_START = (
 _LOG_REFRESH_TRIPS_DONE = (
     "E2E-DEBUG async_refresh_trips DONE for vehicle %s — coordinator.data=%s"
 )
+_LOG_BOUNDARY_REFRESH_SCHEDULED = "Next boundary refresh for vehicle %s at %s"
+
+# Delay before a save-triggered refresh runs. Service handlers push fresh
+# data themselves (async_refresh_trips) and cancel it within this window.
+TRIPS_CHANGED_COOLDOWN_SECONDS = 1.0
+
+# Trip part of coordinator.data when the vehicle has no trips at all. Read-only
+# so the same instance can be handed out on every refresh.
+_EMPTY_TRIP_DATA: Mapping[str, Any] = MappingProxyType(
+    {
+        "recurring_trips": MappingProxyType({}),
+        "punctual_trips": MappingProxyType({}),
+        "kwh_today": 0.0,
+        "hours_today": 0.0,
+        "next_trip": None,
+    }
+)
 
 
 @dataclass(frozen=True)
@@ -54,7 +72,8 @@ class CoordinatorConfig:
 
     emhass_adapter: EMHASSAdapter | None = None
     logger: logging.Logger | None = None
-    update_interval: timedelta = timedelta(seconds=UPDATE_INTERVAL_SECONDS)
+    # None = push-driven: refreshed on trip mutations and time boundaries only
+    update_interval: timedelta | None = None
 
 
 class TripPlannerCoordinator(DataUpdateCoordinator):
@@ -64,7 +83,10 @@ class TripPlannerCoordinator(DataUpdateCoordinator):
     reading from TripManager on each refresh cycle and exposing it via
     coordinator.data for all sensors to consume via CoordinatorEntity pattern.
 
-    update_interval: 120s — balanced for trip planning, not real-time telemetry.
+    update_interval: None — updates are push-driven. TripManager notifies the
+    coordinator after every persisted mutation (async_handle_trips_changed) and
+    a point-in-time timer refreshes at the next time boundary (UTC midnight for
+    kwh_today/hours_today, or the departure of next_trip if sooner).
     Data contract (Phase 1 - EMHASS keys as None):
         {
             "recurring_trips": dict of trip_id -> trip_data,
@@ -78,9 +100,6 @@ class TripPlannerCoordinator(DataUpdateCoordinator):
         }
     """
 
-    # qg-accepted: AP05 — standard polling interval for trip planning (2min > HA default 30s)
-    update_interval = timedelta(seconds=UPDATE_INTERVAL_SECONDS)  # type: ignore[assignment]
-
     def __init__(
         self,
         hass: HomeAssistant,
@@ -97,11 +116,18 @@ class TripPlannerCoordinator(DataUpdateCoordinator):
             config: Optional configuration for coordinator dependencies.
         """
         cfg = config or CoordinatorConfig()
+        logger = cfg.logger or _LOGGER
         super().__init__(
             hass,
-            logger=cfg.logger or _LOGGER,
+            logger=logger,
             name=f"{DOMAIN} ({entry.entry_id})",
             update_interval=cfg.update_interval,
+            request_refresh_debouncer=Debouncer(
+                hass,
+                logger,
+                cooldown=TRIPS_CHANGED_COOLDOWN_SECONDS,
+                immediate=False,
+            ),
         )
         self._trip_manager = trip_manager
         self._entry = entry
@@ -109,6 +135,7 @@ class TripPlannerCoordinator(DataUpdateCoordinator):
         self._vehicle_id = (
             self._entry.data.get(CONF_VEHICLE_NAME, "unknown").lower().replace(" ", "_")
         )
+        self._unsub_boundary_refresh: CALLBACK_TYPE | None = None
 
     @property
     def vehicle_id(self) -> str:
@@ -132,6 +159,9 @@ class TripPlannerCoordinator(DataUpdateCoordinator):
 
         Returns:
             Full data dict with EMHASS keys as None (Phase 1).
+
+        Raises:
+            UpdateFailed: If TripManager cannot provide the trip data.
         """
         # E2E-DEBUG-CRITICAL: Log when _async_update_data is called
         _LOGGER.debug(
@@ -140,22 +170,14 @@ class TripPlannerCoordinator(DataUpdateCoordinator):
         )
         # E2E-DEBUG-CRITICAL: Log current trips from trip_manager
         _LOGGER.debug(_LOG_UPDATE_DATA_TRIPS_BEFORE)
-        # Get recurring trips as list, convert to dict keyed by trip_id
-        recurring_list = await self._trip_manager._crud.async_get_recurring_trips()
-        recurring_trips = {trip["id"]: trip for trip in recurring_list if "id" in trip}
-
-        # Get punctual trips as list, convert to dict keyed by trip_id
-        punctual_list = await self._trip_manager._crud.async_get_punctual_trips()
-        punctual_trips = {trip["id"]: trip for trip in punctual_list if "id" in trip}
-
-        # Get today's energy and hours needs
-        kwh_today = await self._trip_manager._soc_query.async_get_kwh_needed_today()
-        hours_today = float(
-            await self._trip_manager._soc_query.async_get_hours_needed_today()
-        )
-
-        # Get next scheduled trip
-        next_trip = await self._trip_manager._navigator.async_get_next_trip()
+        try:
+            trip_data = await self._async_fetch_trip_data()
+        except (KeyError, TypeError, ValueError) as err:
+            # Malformed stored trips. update_interval is None, so make sure a
+            # boundary refresh is still pending or nothing would retry.
+            if self._unsub_boundary_refresh is None:
+                self._async_schedule_boundary_refresh(None)
+            raise UpdateFailed(f"Error updating trip data: {err}") from err
 
         # PHASE 3 (3.4): Get EMHASS data from emhass_adapter if available
         if self._emhass_adapter is not None:
@@ -173,41 +195,49 @@ class TripPlannerCoordinator(DataUpdateCoordinator):
                 "per_trip_emhass_params": {},
             }
 
+        self._async_schedule_boundary_refresh(trip_data["next_trip"])
+
+        data = trip_data | emhass_data
         # E2E-DEBUG-CRITICAL: Log complete returned coordinator.data structure
-        _LOGGER.debug(
-            _LOG_UPDATE_DATA_RETURNING,
-            list(
-                {
-                    "recurring_trips": recurring_trips,
-                    "punctual_trips": punctual_trips,
-                    "kwh_today": kwh_today,
-                    "hours_today": hours_today,
-                    "next_trip": next_trip,
-                    "per_trip_emhass_params": emhass_data.get(
-                        "per_trip_emhass_params", {}
-                    ),
-                    "emhass_power_profile": emhass_data.get("emhass_power_profile"),
-                    "emhass_deferrables_schedule": emhass_data.get(
-                        "emhass_deferrables_schedule"
-                    ),
-                    "emhass_status": emhass_data.get("emhass_status"),
-                }.keys()
-            ),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(_LOG_UPDATE_DATA_RETURNING, list(data.keys()))
+        return data
+
+    async def _async_fetch_trip_data(self) -> Mapping[str, Any]:
+        """Read the trip keys of coordinator.data from TripManager."""
+        trip_manager = self._trip_manager
+        recurring_list = await trip_manager._crud.async_get_recurring_trips()
+        punctual_list = await trip_manager._crud.async_get_punctual_trips()
+
+        if not recurring_list and not punctual_list:
+            # Fresh install / all trips deleted: nothing to compute
+            return _EMPTY_TRIP_DATA
 
+        kwh_today = await trip_manager._soc_query.async_get_kwh_needed_today()
+        next_trip = await trip_manager._navigator.async_get_next_trip()
         return {
-            "recurring_trips": recurring_trips,
-            "punctual_trips": punctual_trips,
+            # Convert trip lists to dicts keyed by trip_id
+            "recurring_trips": {
+                trip["id"]: trip for trip in recurring_list if "id" in trip
+            },
+            "punctual_trips": {
+                trip["id"]: trip for trip in punctual_list if "id" in trip
+            },
             "kwh_today": kwh_today,
-            "hours_today": hours_today,
+            # Derive hours from kwh_today instead of re-scanning all trips via
+            # async_get_hours_needed_today (which recomputes kwh internally)
+            "hours_today": float(trip_manager._soc_query.hours_for_kwh(kwh_today)),
             "next_trip": next_trip,
-        } | emhass_data
+        }
 
     async def async_refresh_trips(self) -> None:
         """Refresh trip data from TripManager.
 
         This method is called by service handlers after trip CRUD operations
-        to trigger an immediate refresh of the coordinator data.
+        to trigger an immediate refresh of the coordinator data. async_refresh
+        also cancels the save-triggered refresh still waiting in the
+        debouncer, so a mutation costs a single fetch, and a failure is
+        recorded and logged once by the regular refresh path.
         """
         _LOGGER.debug(
             _LOG_REFRESH_TRIPS_START,
@@ -220,3 +250,57 @@ class TripPlannerCoordinator(DataUpdateCoordinator):
             self._vehicle_id,
             "None" if self.data is None else list(self.data.keys()),
         )
+
+    @callback
+    def async_handle_trips_changed(self) -> None:
+        """Schedule a refresh after TripManager persisted a trip mutation.
+
+        Registered via TripManager.register_listener. Goes through the
+        trailing-edge debouncer so bursts of saves (e.g. a weekly pattern
+        import) collapse into a single refresh, and a service handler's
+        async_refresh_trips can cancel it.
+        """
+        self._debounced_refresh.async_schedule_call()
+
+    @callback
+    def _async_schedule_boundary_refresh(
+        self, next_trip: dict[str, Any] | None
+    ) -> None:
+        """Schedule the next time-driven refresh.
+
+        kwh_today/hours_today roll over at UTC midnight and next_trip changes
+        once its departure passes, so the earliest of the two is the only
+        point at which data can change without a trip mutation.
+        """
+        if self._unsub_boundary_refresh is not None:
+            self._unsub_boundary_refresh()
+        now = dt_util.utcnow()
+        point = datetime.combine(
+            now.date() + timedelta(days=1), time.min, tzinfo=timezone.utc
+        )
+        if next_trip:
+            trip_time = self._trip_manager._soc_query._get_trip_time(next_trip)
+            if trip_time is not None and now < trip_time < point:
+                point = trip_time
+        _LOGGER.debug(_LOG_BOUNDARY_REFRESH_SCHEDULED, self._vehicle_id, point)
+        self._unsub_boundary_refresh = async_track_point_in_utc_time(
+            self.hass, self._async_handle_boundary_refresh, point
+        )
+
+    async def _async_handle_boundary_refresh(self, _now: datetime) -> None:
+        """Refresh when a time boundary is reached (reschedules itself).
+
+        A successful refresh arms the next boundary from fresh data; if the
+        refresh failed before that, fall back to the next UTC midnight.
+        """
+        self._unsub_boundary_refresh = None
+        await self.async_refresh()
+        if self._unsub_boundary_refresh is None:
+            self._async_schedule_boundary_refresh(None)
+
+    async def async_shutdown(self) -> None:
+        """Cancel the pending boundary refresh and shut down the coordinator."""
+        if self._unsub_boundary_refresh is not None:
+            self._unsub_boundary_refresh()
+            self._unsub_boundary_refresh = None
+        await super().async_shutdown()
@@ -226,11 +226,7 @@ def _store_vehicle_panel_mapping(  # pragma: no mutate  # EQ-020
         vehicle_id: Unique vehicle identifier
         frontend_url_path: URL path where the panel is registered
     """
-    if VEHICLE_PANEL_MAPPING_KEY not in hass.data:
-        hass.data[VEHICLE_PANEL_MAPPING_KEY] = {}
-
-    # guard: VEHICLE_PANEL_MAPPING_KEY checked in if block above
-    hass.data[VEHICLE_PANEL_MAPPING_KEY][vehicle_id] = frontend_url_path
+    hass.data.setdefault(VEHICLE_PANEL_MAPPING_KEY, {})[vehicle_id] = frontend_url_path
     _LOGGER.debug(
         "Stored panel mapping: vehicle_id=%s -> path=%s",
         vehicle_id,
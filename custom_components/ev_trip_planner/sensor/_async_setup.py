@@ -174,7 +174,7 @@ async def _async_create_trip_sensors(
                     err,
                 )
 
-        _LOGGER.info(
+        _LOGGER.debug(
             "Created %d trip sensors for vehicle %s",
             len(entities),
             vehicle_id,
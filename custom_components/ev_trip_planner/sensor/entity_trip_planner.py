@@ -5,7 +5,8 @@ Extracted from sensor_orig.py as part of the SOLID decomposition (Spec 3).
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Dict
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping
 
 from homeassistant.components.sensor import RestoreSensor, SensorEntity  # noqa: F401
 from homeassistant.helpers import device_registry as dr
@@ -55,8 +56,12 @@ class TripPlannerSensor(
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_has_entity_name = True
         self._attr_name = f"EV Trip Planner {entity_description.key}"
-        # Store cached attributes for synchronous access
-        self._cached_attrs: Dict[str, Any] = {}
+        # value_fn/attrs_fn results for the coordinator.data snapshot in
+        # _cached_data; HA reads both on every state write and template render.
+        # Attributes are read-only since every read shares the same mapping.
+        self._cached_attrs: Mapping[str, Any] = MappingProxyType({})
+        self._cached_value: Any = None
+        self._cached_data: Dict[str, Any] | None = None
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass.
@@ -71,23 +76,35 @@ class TripPlannerSensor(
             if last_state is not None:
                 self._attr_native_value = last_state.state
 
+    def _refresh_cache(self, data: Dict[str, Any]) -> None:
+        """Recompute value and attributes when coordinator.data was replaced."""
+        if data is self._cached_data:
+            return
+        value_fn = getattr(self.entity_description, "value_fn", lambda _: None)
+        attrs_fn: Callable[[Dict[str, Any]], Dict[str, Any]] = getattr(
+            self.entity_description, "attrs_fn", lambda _: {}
+        )
+        self._cached_value = value_fn(data)
+        self._cached_attrs = MappingProxyType(attrs_fn(data))
+        self._cached_data = data
+
     @property
     def native_value(self) -> Any:
         """Return sensor value via entity_description.value_fn."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        value_fn = getattr(self.entity_description, "value_fn", lambda _: None)
-        return value_fn(self.coordinator.data)
+        self._refresh_cache(data)
+        return self._cached_value
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return attributes from coordinator.data via entity_description.attrs_fn."""
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return {}
-        attrs_fn: Callable[[Dict[str, Any]], Dict[str, Any]] = getattr(
-            self.entity_description, "attrs_fn", lambda _: {}
-        )
-        return attrs_fn(self.coordinator.data)
+        self._refresh_cache(data)
+        return self._cached_attrs
 
     @property
     def device_info(self) -> DeviceInfo | None:
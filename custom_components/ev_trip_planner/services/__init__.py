@@ -74,6 +74,60 @@ __all__ = [
 ]
 
 
+# Service schemas are built once at import time rather than on every
+# register_services() call.
+_SCHEMA_ADD_RECURRING = vol.Schema(
+    {
+        vol.Required("vehicle_id"): str,
+        vol.Required("dia_semana"): str,
+        vol.Required("hora"): str,
+        vol.Required("km"): vol.Coerce(float),
+        vol.Required("kwh"): vol.Coerce(float),
+        vol.Optional("descripcion", default=""): str,
+    }
+)
+_SCHEMA_ADD_PUNCTUAL = vol.Schema(
+    {
+        vol.Required("vehicle_id"): str,
+        vol.Required("datetime"): str,
+        vol.Required("km"): vol.Coerce(float),
+        vol.Required("kwh"): vol.Coerce(float),
+        vol.Optional("descripcion", default=""): str,
+    }
+)
+_SCHEMA_EDIT_TRIP = vol.Schema(
+    {
+        vol.Required("vehicle_id"): str,
+        vol.Required("trip_id"): str,
+        vol.Required("updates"): dict,
+    }
+)
+_SCHEMA_IMPORT_WEEKLY_PATTERN = vol.Schema(
+    {
+        vol.Required("vehicle_id"): str,
+        vol.Required("pattern"): dict,
+        vol.Optional("clear_existing", default=True): bool,
+    }
+)
+_SCHEMA_TRIP_LIST = vol.Schema({vol.Required("vehicle_id"): str})
+_SCHEMA_TRIP_GET = vol.Schema(
+    {
+        vol.Required("vehicle_id"): str,
+        vol.Required("trip_id"): str,
+    }
+)
+
+# Services that only take vehicle_id + trip_id share trip_id_schema and
+# differ only in the handler factory.
+_TRIP_ID_SERVICES = (
+    ("delete_trip", make_delete_trip_handler),
+    ("pause_recurring_trip", make_pause_recurring_handler),
+    ("resume_recurring_trip", make_resume_recurring_handler),
+    ("complete_punctual_trip", make_complete_punctual_handler),
+    ("cancel_punctual_trip", make_cancel_punctual_handler),
+)
+
+
 def register_services(hass: HomeAssistant) -> None:  # pragma: no mutate
     """Register all ev_trip_planner services using handler factories.
 
@@ -85,42 +139,19 @@ def register_services(hass: HomeAssistant) -> None:  # pragma: no mutate
         "ev_trip_planner",
         "add_recurring_trip",
         make_add_recurring_handler(hass),
-        schema=vol.Schema(
-            {
-                vol.Required("vehicle_id"): str,
-                vol.Required("dia_semana"): str,
-                vol.Required("hora"): str,
-                vol.Required("km"): vol.Coerce(float),
-                vol.Required("kwh"): vol.Coerce(float),
-                vol.Optional("descripcion", default=""): str,
-            }
-        ),
+        schema=_SCHEMA_ADD_RECURRING,
     )
     hass.services.async_register(
         "ev_trip_planner",
         "add_punctual_trip",
         make_add_punctual_handler(hass),
-        schema=vol.Schema(
-            {
-                vol.Required("vehicle_id"): str,
-                vol.Required("datetime"): str,
-                vol.Required("km"): vol.Coerce(float),
-                vol.Required("kwh"): vol.Coerce(float),
-                vol.Optional("descripcion", default=""): str,
-            }
-        ),
+        schema=_SCHEMA_ADD_PUNCTUAL,
     )
     hass.services.async_register(
         "ev_trip_planner",
         "edit_trip",
         make_edit_trip_handler(hass),
-        schema=vol.Schema(
-            {
-                vol.Required("vehicle_id"): str,
-                vol.Required("trip_id"): str,
-                vol.Required("updates"): dict,
-            }
-        ),
+        schema=_SCHEMA_EDIT_TRIP,
     )
     hass.services.async_register(
         "ev_trip_planner",
@@ -134,64 +165,30 @@ def register_services(hass: HomeAssistant) -> None:  # pragma: no mutate
         make_trip_create_handler(hass),
         schema=trip_create_schema,
     )
-    hass.services.async_register(
-        "ev_trip_planner",
-        "delete_trip",
-        make_delete_trip_handler(hass),
-        schema=trip_id_schema,
-    )
-    hass.services.async_register(
-        "ev_trip_planner",
-        "pause_recurring_trip",
-        make_pause_recurring_handler(hass),
-        schema=trip_id_schema,
-    )
-    hass.services.async_register(
-        "ev_trip_planner",
-        "resume_recurring_trip",
-        make_resume_recurring_handler(hass),
-        schema=trip_id_schema,
-    )
-    hass.services.async_register(
-        "ev_trip_planner",
-        "complete_punctual_trip",
-        make_complete_punctual_handler(hass),
-        schema=trip_id_schema,
-    )
-    hass.services.async_register(
-        "ev_trip_planner",
-        "cancel_punctual_trip",
-        make_cancel_punctual_handler(hass),
-        schema=trip_id_schema,
-    )
+    for service, factory in _TRIP_ID_SERVICES:
+        hass.services.async_register(
+            "ev_trip_planner",
+            service,
+            factory(hass),
+            schema=trip_id_schema,
+        )
     hass.services.async_register(
         "ev_trip_planner",
         "import_from_weekly_pattern",
         make_import_weekly_pattern_handler(hass),
-        schema=vol.Schema(
-            {
-                vol.Required("vehicle_id"): str,
-                vol.Required("pattern"): dict,
-                vol.Optional("clear_existing", default=True): bool,
-            }
-        ),
+        schema=_SCHEMA_IMPORT_WEEKLY_PATTERN,
     )
     hass.services.async_register(
         "ev_trip_planner",
         "trip_list",
         make_trip_list_handler(hass),
-        schema=vol.Schema({vol.Required("vehicle_id"): str}),
+        schema=_SCHEMA_TRIP_LIST,
         supports_response=SupportsResponse.ONLY,
     )
     hass.services.async_register(
         "ev_trip_planner",
         "trip_get",
         make_trip_get_handler(hass),
-        schema=vol.Schema(
-            {
-                vol.Required("vehicle_id"): str,
-                vol.Required("trip_id"): str,
-            }
-        ),
+        schema=_SCHEMA_TRIP_GET,
         supports_response=SupportsResponse.ONLY,
     )
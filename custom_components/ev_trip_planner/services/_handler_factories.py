@@ -7,7 +7,8 @@ Helpers (_get_manager, _get_coordinator, etc.) are defined in _utils.py.
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant.core import HomeAssistant, ServiceCall
@@ -22,12 +23,14 @@ from ._helpers import (
     get_vehicle_id,
 )
 from ._utils import (
-    _ensure_setup,
     _find_entry_by_vehicle,
     _get_coordinator,
     _get_manager,
 )
 
+if TYPE_CHECKING:
+    from ..trip.manager import TripManager
+
 # ── Log format string constants (US-5 testability) ──────────────────────
 _LOG_HANDLER_TRIP_LIST_CALLED = "=== trip_list SERVICE HANDLER CALLED ==="
 _LOG_HANDLER_GET_MANAGER_OK = "=== _get_manager returned manager ==="
@@ -69,9 +72,6 @@ _LOG_TRIP_GET_SERVICE_CALLED = (
 )
 _LOG_TRIP_GET_SUCCESS = "=== trip_get SUCCESS - Found trip: %s ==="
 _LOG_TRIP_GET_NOT_FOUND = "=== trip_get NOT FOUND - trip_id: %s ==="
-_LOG_GETTING_ALL_TO_FIND = "Getting all trips to find trip_id: %s"
-_LOG_FOUND_TRIPS_COUNT = "Found %d recurring and %d punctual trips"
-_LOG_SEARCHING_FOR_ID = "Searching through %d trips for ID: %s"
 _LOG_FOUND_TRIP = "Found trip: %s"
 _LOG_ERROR_GETTING_TRIP = "Error getting trip %s for vehicle %s: %s"
 _LOG_FINDING_ALL_TO_FIND_ID = "Getting all trips to find trip_id: %s"
@@ -121,6 +121,14 @@ trip_create_schema = vol.Schema(
 )
 
 
+async def _async_refresh_coordinator(hass: HomeAssistant, vehicle_id: str) -> None:
+    """Refresh the vehicle's coordinator after a trip mutation, if loaded."""
+    coordinator = _get_coordinator(hass, vehicle_id)
+    if coordinator:
+        _LOGGER.debug(_LOG_REFRESH, vehicle_id)
+        await coordinator.async_refresh_trips()
+
+
 # === Factory: add_recurring_trip ===
 
 
@@ -138,10 +146,7 @@ def make_add_recurring_handler(hass: HomeAssistant):  # pragma: no mutate  # EQ-
             kwh=float(data["kwh"]),
             descripcion=get_str(data, "descripcion"),
         )
-        coordinator = _get_coordinator(hass, vehicle_id)
-        if coordinator:
-            _LOGGER.debug(_LOG_REFRESH, vehicle_id)
-            await coordinator.async_refresh_trips()
+        await _async_refresh_coordinator(hass, vehicle_id)
 
     return handler
 
@@ -162,10 +167,7 @@ def make_add_punctual_handler(hass: HomeAssistant):  # pragma: no mutate  # EQ-0
             kwh=float(data["kwh"]),
             descripcion=get_str(data, "descripcion"),
         )
-        coordinator = _get_coordinator(hass, vehicle_id)
-        if coordinator:
-            _LOGGER.debug(_LOG_REFRESH, vehicle_id)
-            await coordinator.async_refresh_trips()
+        await _async_refresh_coordinator(hass, vehicle_id)
 
     return handler
 
@@ -183,7 +185,7 @@ def make_trip_update_handler(hass: HomeAssistant):  # pragma: no mutate  # EQ-00
         trip_id = str(data["trip_id"])
 
         if "updates" in data:
-            updates = dict(data["updates"])
+            updates = data["updates"]
         else:
             updates: dict[str, Any] = {}
             for src, dst in [
@@ -212,31 +214,20 @@ def make_trip_update_handler(hass: HomeAssistant):  # pragma: no mutate  # EQ-00
             return
 
         mgr = await _get_manager(hass, vehicle_id)
-        await _ensure_setup(mgr)
         await mgr._crud.async_update_trip(trip_id, updates)
 
         try:
             from ..sensor import async_update_trip_sensor
 
-            t = "recurrente" if updates.get("dia_semana") else "puntual"
-            trips = (
-                await mgr._crud.async_get_recurring_trips()
-                if t == "recurrente"
-                else await mgr._crud.async_get_punctual_trips()
-            )
-            for trip in trips:
-                if str(trip.get("id")) == trip_id:
-                    await async_update_trip_sensor(
-                        hass, entry.entry_id, trip.copy() | {"id": trip_id}
-                    )
-                    break
+            trip = await mgr._crud.async_get_trip(trip_id)
+            if trip:
+                await async_update_trip_sensor(
+                    hass, entry.entry_id, trip.copy() | {"id": trip_id}
+                )
         except Exception as err:
             _LOGGER.warning(_LOG_UPDATE_FAILED, err)
 
-        coordinator = _get_coordinator(hass, vehicle_id)
-        if coordinator:
-            _LOGGER.debug(_LOG_REFRESH, vehicle_id)
-            await coordinator.async_refresh_trips()
+        await _async_refresh_coordinator(hass, vehicle_id)
 
     return handler
 
@@ -251,115 +242,66 @@ def make_edit_trip_handler(hass: HomeAssistant):  # pragma: no mutate  # EQ-006-
         data = call.data
         vehicle_id = data["vehicle_id"]
         mgr = await _get_manager(hass, vehicle_id)
-        await _ensure_setup(mgr)
-        await mgr._crud.async_update_trip(str(data["trip_id"]), dict(data["updates"]))
-        coordinator = _get_coordinator(hass, vehicle_id)
-        if coordinator:
-            _LOGGER.debug(_LOG_REFRESH, vehicle_id)
-            await coordinator.async_refresh_trips()
+        await mgr._crud.async_update_trip(str(data["trip_id"]), data["updates"])
+        await _async_refresh_coordinator(hass, vehicle_id)
 
     return handler
 
 
-# === Factory: delete_trip ===
+# === Factories: trip_id-only services ===
+# delete/pause/resume/complete/cancel differ only in the TripManager method
+# they call, so they share one generic handler.
 
 
-def make_delete_trip_handler(hass: HomeAssistant):  # pragma: no mutate  # EQ-006-5
-    """Return async handler for delete_trip service."""
+def _make_trip_id_handler(
+    hass: HomeAssistant,
+    action: Callable[[TripManager, str], Awaitable[Any]],
+):
+    """Return async handler awaiting ``action(mgr, trip_id)``."""
 
     async def handler(call: ServiceCall) -> None:
         data = call.data
         vehicle_id = data["vehicle_id"]
-        trip_id = str(data["trip_id"])
         mgr = await _get_manager(hass, vehicle_id)
-        await _ensure_setup(mgr)
-        await mgr._crud.async_delete_trip(trip_id)
-        coordinator = _get_coordinator(hass, vehicle_id)
-        if coordinator:
-            _LOGGER.debug(_LOG_REFRESH, vehicle_id)
-            await coordinator.async_refresh_trips()
+        await action(mgr, str(data["trip_id"]))
+        await _async_refresh_coordinator(hass, vehicle_id)
 
     return handler
 
 
-# === Factory: pause_recurring_trip ===
+def make_delete_trip_handler(hass: HomeAssistant):  # pragma: no mutate  # EQ-006-5
+    """Return async handler for delete_trip service."""
+    return _make_trip_id_handler(
+        hass, lambda mgr, trip_id: mgr._crud.async_delete_trip(trip_id)
+    )
 
 
 def make_pause_recurring_handler(hass: HomeAssistant):  # pragma: no mutate  # EQ-006-6
     """Return async handler for pause_recurring_trip service."""
-
-    async def handler(call: ServiceCall) -> None:
-        data = call.data
-        vehicle_id = data["vehicle_id"]
-        mgr = await _get_manager(hass, vehicle_id)
-        await _ensure_setup(mgr)
-        await mgr._lifecycle.async_pause_recurring_trip(str(data["trip_id"]))
-        coordinator = _get_coordinator(hass, vehicle_id)
-        if coordinator:
-            _LOGGER.debug(_LOG_REFRESH, vehicle_id)
-            await coordinator.async_refresh_trips()
-
-    return handler
-
-
-# === Factory: resume_recurring_trip ===
+    return _make_trip_id_handler(
+        hass, lambda mgr, trip_id: mgr._lifecycle.async_pause_recurring_trip(trip_id)
+    )
 
 
 def make_resume_recurring_handler(hass: HomeAssistant):  # pragma: no mutate  # EQ-006-7
     """Return async handler for resume_recurring_trip service."""
-
-    async def handler(call: ServiceCall) -> None:
-        data = call.data
-        vehicle_id = data["vehicle_id"]
-        mgr = await _get_manager(hass, vehicle_id)
-        await _ensure_setup(mgr)
-        await mgr._lifecycle.async_resume_recurring_trip(str(data["trip_id"]))
-        coordinator = _get_coordinator(hass, vehicle_id)
-        if coordinator:
-            _LOGGER.debug(_LOG_REFRESH, vehicle_id)
-            await coordinator.async_refresh_trips()
-
-    return handler
-
-
-# === Factory: complete_punctual_trip ===
+    return _make_trip_id_handler(
+        hass, lambda mgr, trip_id: mgr._lifecycle.async_resume_recurring_trip(trip_id)
+    )
 
 
 def make_complete_punctual_handler(hass: HomeAssistant):
     """Return async handler for complete_punctual_trip service."""
-
-    async def handler(call: ServiceCall) -> None:
-        data = call.data
-        vehicle_id = data["vehicle_id"]
-        mgr = await _get_manager(hass, vehicle_id)
-        await _ensure_setup(mgr)
-        await mgr._lifecycle.async_complete_punctual_trip(str(data["trip_id"]))
-        coordinator = _get_coordinator(hass, vehicle_id)
-        if coordinator:
-            _LOGGER.debug(_LOG_REFRESH, vehicle_id)
-            await coordinator.async_refresh_trips()
-
-    return handler
-
-
-# === Factory: cancel_punctual_trip ===
+    return _make_trip_id_handler(
+        hass, lambda mgr, trip_id: mgr._lifecycle.async_complete_punctual_trip(trip_id)
+    )
 
 
 def make_cancel_punctual_handler(hass: HomeAssistant):  # pragma: no mutate  # EQ-006-9
     """Return async handler for cancel_punctual_trip service."""
-
-    async def handler(call: ServiceCall) -> None:
-        data = call.data
-        vehicle_id = data["vehicle_id"]
-        mgr = await _get_manager(hass, vehicle_id)
-        await _ensure_setup(mgr)
-        await mgr._lifecycle.async_cancel_punctual_trip(str(data["trip_id"]))
-        coordinator = _get_coordinator(hass, vehicle_id)
-        if coordinator:
-            _LOGGER.debug(_LOG_REFRESH, vehicle_id)
-            await coordinator.async_refresh_trips()
-
-    return handler
+    return _make_trip_id_handler(
+        hass, lambda mgr, trip_id: mgr._lifecycle.async_cancel_punctual_trip(trip_id)
+    )
 
 
 # === Factory: trip_create ===
@@ -402,10 +344,7 @@ def make_trip_create_handler(hass: HomeAssistant):  # pragma: no mutate  # EQ-00
             _LOGGER.error(_LOG_INVALID_TRIP_TYPE, trip_type, vehicle_id)
             return
 
-        coordinator = _get_coordinator(hass, vehicle_id)
-        if coordinator:
-            _LOGGER.debug(_LOG_REFRESH, vehicle_id)
-            await coordinator.async_refresh_trips()
+        await _async_refresh_coordinator(hass, vehicle_id)
 
     return handler
 
@@ -418,31 +357,28 @@ def make_import_weekly_pattern_handler(hass: HomeAssistant):
 
     async def handler(call: ServiceCall) -> None:
         data = call.data
-        mgr = await _get_manager(hass, data["vehicle_id"])
-        await _ensure_setup(mgr)
-
-        clear_existing = get_bool(data, "clear_existing", True)
-        pattern: dict[str, Any] = dict(data["pattern"])
-
-        if clear_existing:
-            try:
-                existing = await mgr._crud.async_get_recurring_trips()
-            except Exception:
-                existing = []
-            for trip in existing:
-                trip_id = str(trip.get("id"))
-                if trip_id:
-                    await mgr._crud.async_delete_trip(trip_id)
-
-        for dia, items in pattern.items():
-            for item in items or []:
-                await mgr._crud.async_add_recurring_trip(
-                    dia_semana=dia,
-                    hora=str(item["hora"]),
-                    km=float(item["km"]),
-                    kwh=float(item["kwh"]),
-                    descripcion=get_str(item, "descripcion"),
-                )
+        vehicle_id = data["vehicle_id"]
+        mgr = await _get_manager(hass, vehicle_id)
+
+        trips = [
+            {
+                "dia_semana": dia,
+                "hora": str(item["hora"]),
+                "km": float(item["km"]),
+                "kwh": float(item["kwh"]),
+                "descripcion": get_str(item, "descripcion"),
+            }
+            for dia, items in data["pattern"].items()
+            for item in items or []
+        ]
+
+        # One storage write for the whole import instead of one per trip
+        if get_bool(data, "clear_existing", True):
+            await mgr._crud.async_replace_recurring_trips(trips)
+        else:
+            await mgr._crud.async_add_recurring_trips(trips)
+
+        await _async_refresh_coordinator(hass, vehicle_id)
 
     return handler
 
@@ -487,28 +423,30 @@ def make_trip_list_handler(hass: HomeAssistant):  # pragma: no mutate  # EQ-006-
                 vehicle_id,
             )
 
-            for i, trip in enumerate(recurring_trips):
-                _LOGGER.debug(
-                    _LOG_RECURRING_TRIP_ENTRY,
-                    i,
-                    trip.get("id"),
-                    trip.get("tipo"),
-                    trip.get("activo"),
-                )
+            # Per-trip dumps: skip the loops entirely unless DEBUG is on
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                for i, trip in enumerate(recurring_trips):
+                    _LOGGER.debug(
+                        _LOG_RECURRING_TRIP_ENTRY,
+                        i,
+                        trip.get("id"),
+                        trip.get("tipo"),
+                        trip.get("activo"),
+                    )
 
-            for i, trip in enumerate(punctual_trips):
-                _LOGGER.debug(
-                    _LOG_PUNCTUAL_TRIP_ENTRY,
-                    i,
-                    trip.get("id"),
-                    trip.get("tipo"),
-                    trip.get("estado"),
-                )
+                for i, trip in enumerate(punctual_trips):
+                    _LOGGER.debug(
+                        _LOG_PUNCTUAL_TRIP_ENTRY,
+                        i,
+                        trip.get("id"),
+                        trip.get("tipo"),
+                        trip.get("estado"),
+                    )
 
             result = {
                 "vehicle_id": vehicle_id,
-                "recurring_trips": recurring_trips,
-                "punctual_trips": punctual_trips,
+                "recurring_trips": list(recurring_trips),
+                "punctual_trips": list(punctual_trips),
                 "total_trips": len(recurring_trips) + len(punctual_trips),
             }
             _LOGGER.debug(_LOG_HANDLER_TRIP_LIST_RESULT)
@@ -552,25 +490,10 @@ def make_trip_get_handler(hass: HomeAssistant):  # pragma: no mutate  # EQ-006-1
         _LOGGER.debug(_LOG_HANDLER_GET_MANAGER_OK)
 
         try:
-            _LOGGER.warning(_LOG_GETTING_ALL_TO_FIND, trip_id)
-            recurring_trips = await mgr._crud.async_get_recurring_trips()
-            punctual_trips = await mgr._crud.async_get_punctual_trips()
-
-            _LOGGER.warning(
-                _LOG_FOUND_TRIPS_COUNT, len(recurring_trips), len(punctual_trips)
-            )
-
-            all_trips = [*recurring_trips, *punctual_trips]
-
-            _LOGGER.warning(_LOG_SEARCHING_FOR_ID, len(all_trips), trip_id)
-            trip_found = None
-            for trip in all_trips:
-                if str(trip.get("id")) == trip_id:
-                    trip_found = trip
-                    _LOGGER.warning(_LOG_FOUND_TRIP, trip)
-                    break
+            trip_found = await mgr._crud.async_get_trip(trip_id)
 
             if trip_found:
+                _LOGGER.warning(_LOG_FOUND_TRIP, trip_found)
                 _LOGGER.debug(_LOG_TRIP_GET_SUCCESS, trip_found)
                 return {
                     "vehicle_id": vehicle_id,
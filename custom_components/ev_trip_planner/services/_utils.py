@@ -143,14 +143,6 @@ async def _get_manager(  # pragma: no mutate — 45 equivalent survivors (string
     return trip_manager
 
 
-async def _ensure_setup(mgr: TripManager) -> None:
-    """Ensure TripManager is set up before operations.
-
-    The trip_manager from runtime_data should already be set up.
-    """
-    pass
-
-
 def build_presence_config(entry: ConfigEntry) -> dict[str, Any]:
     """Build presence_config dict from entry.data for PresenceMonitor."""
     from ..const import (
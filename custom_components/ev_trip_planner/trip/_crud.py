@@ -7,7 +7,7 @@ add/update/delete/read for trips.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
 
 from ..const import TRIP_TYPE_PUNCTUAL, TRIP_TYPE_RECURRING
 from ..utils import generate_trip_id, validate_hora
@@ -29,6 +29,7 @@ _LOG_ADD_PUNCTUAL_INFO = "Added punctual trip %s for vehicle %s"
 _LOG_UPDATE_DEBUG = "Updating trip %s for vehicle %s: updates=%s"
 _LOG_UPDATE_INFO = "Updated %s trip %s for vehicle %s"
 _LOG_UPDATE_NOT_FOUND = "Trip %s not found for update in vehicle %s"
+_LOG_UPDATE_NOOP_DEBUG = "Trip %s for vehicle %s already up to date, skipping save"
 _LOG_DELETE_DEBUG = "Deleting trip %s from vehicle %s"
 _LOG_DELETE_NOT_FOUND = "Trip %s not found for deletion in vehicle %s"
 _LOG_DELETE_INFO = "Deleted trip %s from vehicle %s"
@@ -93,26 +94,30 @@ class TripCRUD:
 
     # ── Read accessors ───────────────────────────────────────────
 
-    async def async_get_recurring_trips(self) -> List[Dict[str, Any]]:
-        """Obtiene la lista de viajes recurrentes."""
-        return list(self._state.recurring_trips.values())
+    async def async_get_recurring_trips(self) -> Sequence[Dict[str, Any]]:
+        """Obtiene los viajes recurrentes (tupla memoizada hasta el próximo cambio)."""
+        return self._state.trip_list("recurring")
 
-    async def async_get_punctual_trips(self) -> List[Dict[str, Any]]:
-        """Obtiene la lista de viajes puntuales."""
-        return list(self._state.punctual_trips.values())
+    async def async_get_punctual_trips(self) -> Sequence[Dict[str, Any]]:
+        """Obtiene los viajes puntuales (tupla memoizada hasta el próximo cambio)."""
+        return self._state.trip_list("punctual")
+
+    async def async_get_trip(self, trip_id: str) -> Dict[str, Any] | None:
+        """Obtiene un viaje (recurrente o puntual) por su id, sin recorrer listas."""
+        state = self._state
+        return state.recurring_trips.get(trip_id) or state.punctual_trips.get(trip_id)
 
     # ── Add ──────────────────────────────────────────────────────
 
-    async def async_add_recurring_trip(self, **kwargs: Any) -> None:
-        """Añade un nuevo viaje recurrente y sincroniza con EMHASS."""
-        state = self._state
+    def _build_recurring_trip(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Valida y construye el dict de un viaje recurrente (sin guardarlo)."""
         dia_semana = get_str(kwargs, "dia_semana")
         hora = get_str(kwargs, "hora", "")
         km = get_number(kwargs, "km", 0.0)
         kwh = get_number(kwargs, "kwh", 0.0)
         _LOGGER.debug(
             _LOG_ADD_RECURRING_DEBUG,
-            state.vehicle_id,
+            self._state.vehicle_id,
             dia_semana,
             hora,
             km,
@@ -123,7 +128,7 @@ class TripCRUD:
         trip_id = kwargs.get("trip_id") or generate_trip_id(
             "recurrente", get_str(kwargs, "dia_semana", "lunes")
         )
-        state.recurring_trips[trip_id] = {
+        return {
             "id": trip_id,
             "tipo": TRIP_TYPE_RECURRING,
             "dia_semana": kwargs["dia_semana"],
@@ -133,15 +138,57 @@ class TripCRUD:
             "descripcion": get_str(kwargs, "descripcion", ""),
             "activo": get_bool(kwargs, "activo", True),
         }
-        await state.async_save_trips()
-        _LOGGER.info(_LOG_ADD_RECURRING_INFO, trip_id, state.vehicle_id)
 
-        self._emit_post_add("trip_created_recurring", state.recurring_trips[trip_id])
+    async def _async_after_recurring_added(self, trip: Dict[str, Any]) -> None:
+        """Log, emit sensor events and publish to EMHASS for a saved trip."""
+        state = self._state
+        _LOGGER.info(_LOG_ADD_RECURRING_INFO, trip["id"], state.vehicle_id)
+
+        self._emit_post_add("trip_created_recurring", trip)
 
         if state.emhass_adapter:
-            await state._emhass_sync._async_publish_new_trip_to_emhass(
-                state.recurring_trips[trip_id]
-            )
+            await state._emhass_sync._async_publish_new_trip_to_emhass(trip)
+
+    async def async_add_recurring_trip(self, **kwargs: Any) -> None:
+        """Añade un nuevo viaje recurrente y sincroniza con EMHASS."""
+        state = self._state
+        trip = self._build_recurring_trip(kwargs)
+        state.recurring_trips[trip["id"]] = trip
+        state.invalidate_trip_lists()
+        await state.async_save_trips()
+        await self._async_after_recurring_added(trip)
+
+    async def async_add_recurring_trips(self, trips: List[Dict[str, Any]]) -> None:
+        """Añade varios viajes recurrentes con un único guardado.
+
+        Every trip is validated before any is stored, so an invalid entry
+        leaves the existing trips untouched.
+        """
+        state = self._state
+        built = [self._build_recurring_trip(trip) for trip in trips]
+        for trip in built:
+            state.recurring_trips[trip["id"]] = trip
+        state.invalidate_trip_lists()
+        await state.async_save_trips()
+        for trip in built:
+            await self._async_after_recurring_added(trip)
+
+    async def async_replace_recurring_trips(self, trips: List[Dict[str, Any]]) -> None:
+        """Reemplaza todos los viajes recurrentes con un único guardado.
+
+        Punctual trips are left untouched. Sensor/EMHASS cleanup for the
+        removed trips and publication of the new ones still happen per trip.
+        """
+        state = self._state
+        built = [self._build_recurring_trip(trip) for trip in trips]
+        removed_ids = list(state.recurring_trips)
+        state.recurring_trips = {trip["id"]: trip for trip in built}
+        await state.async_save_trips()
+        for trip_id in removed_ids:
+            _LOGGER.info(_LOG_DELETE_INFO, trip_id, state.vehicle_id)
+            await self._async_after_deleted(trip_id)
+        for trip in built:
+            await self._async_after_recurring_added(trip)
 
     async def async_add_punctual_trip(self, **kwargs: Any) -> None:
         """Añade un nuevo viaje puntual y sincroniza con EMHASS."""
@@ -167,6 +214,7 @@ class TripCRUD:
             "descripcion": get_str(kwargs, "descripcion", ""),
             "estado": "pendiente",
         }
+        state.invalidate_trip_lists()
         await state.async_save_trips()
         _LOGGER.info(_LOG_ADD_PUNCTUAL_INFO, trip_id, state.vehicle_id)
 
@@ -187,26 +235,26 @@ class TripCRUD:
         state = self._state
         _LOGGER.debug(_LOG_UPDATE_DEBUG, trip_id, state.vehicle_id, updates)
 
-        old_trip: Dict[str, Any] | None = None
-        trip_type: str | None = None
         if trip_id in state.recurring_trips:
-            old_trip = state.recurring_trips[trip_id].copy()
+            trip = state.recurring_trips[trip_id]
             trip_type = "recurring"
-            filtered = {
-                k: v for k, v in updates.items() if k in _RECURRENT_RELEVANT_FIELDS
-            }
-            state.recurring_trips[trip_id].update(filtered)
+            relevant_fields = _RECURRENT_RELEVANT_FIELDS
         elif trip_id in state.punctual_trips:
-            old_trip = state.punctual_trips[trip_id].copy()
+            trip = state.punctual_trips[trip_id]
             trip_type = "punctual"
-            filtered = {
-                k: v for k, v in updates.items() if k in _PUNCTUAL_RELEVANT_FIELDS
-            }
-            state.punctual_trips[trip_id].update(filtered)
+            relevant_fields = _PUNCTUAL_RELEVANT_FIELDS
         else:
             _LOGGER.warning(_LOG_UPDATE_NOT_FOUND, trip_id, state.vehicle_id)
             return
 
+        filtered = {k: v for k, v in updates.items() if k in relevant_fields}
+        # Nothing would change: skip the save, sensor event and EMHASS sync
+        if all(k in trip and trip[k] == v for k, v in filtered.items()):
+            _LOGGER.debug(_LOG_UPDATE_NOOP_DEBUG, trip_id, state.vehicle_id)
+            return
+        old_trip = trip.copy()
+        trip.update(filtered)
+
         await state.async_save_trips()
         _LOGGER.info(_LOG_UPDATE_INFO, trip_type, trip_id, state.vehicle_id)
 
@@ -243,10 +291,15 @@ class TripCRUD:
             del state.recurring_trips[trip_id]
         else:
             del state.punctual_trips[trip_id]
+        state.invalidate_trip_lists()
 
         await state.async_save_trips()
         _LOGGER.info(_LOG_DELETE_INFO, trip_id, state.vehicle_id)
+        await self._async_after_deleted(trip_id)
 
+    async def _async_after_deleted(self, trip_id: str) -> None:
+        """Emit removal sensor events and drop the trip from EMHASS."""
+        state = self._state
         entry_id = state.entry_id or ""
         emit(SensorEvent("trip_removed", state.hass, entry_id, trip_id=trip_id))
         emit(
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 import yaml
+from homeassistant.core import CALLBACK_TYPE
 from homeassistant.helpers import storage as ha_storage
 from homeassistant.helpers.storage import Store
 
@@ -23,7 +24,7 @@ from .state import TripManagerState
 _LOGGER = logging.getLogger(__name__)
 
 # ── Log format string constants (US-5 testability) ──────────────────
-_LOG_SETUP_INFO = "Configurando gestor de viajes para vehículo: %s"
+_LOG_SETUP_DEBUG = "Configurando gestor de viajes para vehículo: %s"
 _LOG_SAVE_START_INFO = (
     "async_save_trips START - vehicle=%s, recurrentes=%d, puntuales=%d"
 )
@@ -52,14 +53,41 @@ class TripPersistence:
     def __init__(self, state: TripManagerState) -> None:
         """Initialize with shared state."""
         self._state = state
+        self._listeners: list[CALLBACK_TYPE] = []
+        # Set once storage has been read; in-memory state is authoritative
+        # from then on, even when the vehicle has no trips.
+        self._loaded = False
 
     # ── Public API ─────────────────────────────────────────────────
 
+    def register_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Register a callback fired after every trip save or EMHASS publish.
+
+        Every mutation (add/update/delete/pause/resume/complete/cancel)
+        persists through async_save_trips, so this is the single hook
+        consumers need to react to trip changes. Returns a remover.
+        """
+        self._listeners.append(update_callback)
+
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    def notify_listeners(self) -> None:
+        """Fire every registered listener.
+
+        Also called after an EMHASS publish, whose cache feeds coordinator
+        data without any trip being saved.
+        """
+        for update_callback in list(self._listeners):
+            update_callback()
+
     async def async_setup(
         self,
     ) -> None:
         """Configura el gestor de viajes y carga los datos desde el almacenamiento."""
-        _LOGGER.info(_LOG_SETUP_INFO, self._state.vehicle_id)
+        _LOGGER.debug(_LOG_SETUP_DEBUG, self._state.vehicle_id)
         await self._state.vehicle_controller.async_setup()
         await self._load_trips()
         await self._state._schedule.publish_deferrable_loads()
@@ -109,6 +137,10 @@ class TripPersistence:
             except Exception as yaml_err:  # pragma: no cover reason=ha-filesystem-only
                 _LOGGER.error("YAML fallback also failed: %s", yaml_err)
 
+        # In-memory state changed even if persisting failed — notify regardless.
+        state.invalidate_trip_lists()
+        self.notify_listeners()
+
     # ── Private helpers ───────────────────────────────────────────
 
     # qg-accepted: KISS complexity=11 — distinct persistence backends (YAML vs HA Store),
@@ -116,7 +148,12 @@ class TripPersistence:
     async def _load_trips(self) -> None:
         """Carga los viajes desde el almacenamiento persistente."""
         state = self._state
-        if state.punctual_trips or state.recurring_trips or state._trips:
+        if (
+            self._loaded
+            or state.punctual_trips
+            or state.recurring_trips
+            or state._trips
+        ):
             _LOGGER.debug(
                 _LOG_LOAD_SKIP_DEBUG,
                 state.vehicle_id,
@@ -155,6 +192,7 @@ class TripPersistence:
                 )
             else:
                 self._reset_trips()
+            self._loaded = True
         except asyncio.CancelledError:  # pragma: no cover reason=hass-taste-test-timing
             _LOGGER.warning(_LOG_LOAD_CANCEL_WARNING)
             state._trips = {}
@@ -216,3 +216,7 @@ class TripScheduler:
                 await adapter.async_publish_all_deferrable_loads(trips)
             except Exception:
                 _LOGGER.exception("Error publishing deferrable loads to EMHASS")
+                return
+            # The EMHASS cache changed outside a trip save (SOC change,
+            # hourly refresh) — let the coordinator pick it up.
+            self._state._persistence.notify_listeners()
@@ -24,6 +24,7 @@ from ..const import (
     DEFAULT_BATTERY_CAPACITY_KWH,
     DEFAULT_CHARGING_POWER,
     DOMAIN,
+    TRIP_TYPE_PUNCTUAL,
 )
 from ..utils import is_trip_today as pure_is_trip_today
 from ._helpers import get_str
@@ -98,6 +99,16 @@ class SOCHelpers:
         tipo = trip.get("tipo")
         if tipo is None:
             return None
+        if tipo == TRIP_TYPE_PUNCTUAL:
+            datetime_str = get_str(trip, "datetime", "") or None
+            cache = self._state._punctual_time_cache
+            if datetime_str not in cache:
+                cache[datetime_str] = self._compute_trip_time(trip, tipo)
+            return cache[datetime_str]
+        return self._compute_trip_time(trip, tipo)
+
+    def _compute_trip_time(self, trip: Dict[str, Any], tipo: str) -> Optional[datetime]:
+        """Calcula la fecha y hora del viaje respecto a ahora (sin caché)."""
         result = calculate_trip_time(
             tipo,
             get_str(trip, "hora", "") or None,
@@ -134,9 +134,8 @@ class SOCQuery:
         """Calcula la energía necesaria para hoy basado en los viajes."""
         today = datetime.now(timezone.utc).date()
         total_kwh = 0.0
-        for trip in self._state.recurring_trips.values():
-            if trip["activo"] and self._state._soc._is_trip_today(trip, today):
-                total_kwh += trip["kwh"]
+        for trip in self._state.recurring_by_weekday()[today.weekday()]:
+            total_kwh += trip["kwh"]
         for trip in self._state.punctual_trips.values():
             if trip["estado"] == "pendiente" and self._state._soc._is_trip_today(
                 trip, today
@@ -147,6 +146,14 @@ class SOCQuery:
     async def async_get_hours_needed_today(self) -> int:
         """Calcula las horas necesarias para cargar hoy."""
         kwh_needed = await self.async_get_kwh_needed_today()
+        return self.hours_for_kwh(kwh_needed)
+
+    def hours_for_kwh(self, kwh_needed: float) -> int:
+        """Calcula las horas de carga para una energía ya conocida.
+
+        Lets callers that already hold kwh_today (the coordinator) derive
+        hours without re-scanning every trip a second time.
+        """
         charging_power = self._get_charging_power()
         return math.ceil(kwh_needed / charging_power) if charging_power > 0 else 0
 
@@ -32,6 +32,7 @@ _LOG_CANCELLED_PUNCTUAL_INFO = "Cancelled punctual trip %s for vehicle %s"
 _LOG_PUNCTUAL_NOT_FOUND_CANCEL_WARNING = (
     "Punctual trip %s not found for cancellation in vehicle %s"
 )
+_LOG_UNCHANGED_DEBUG = "Trip %s for vehicle %s already %s, skipping save"
 _LOG_TRIP_NOT_FOUND_SENSOR_UPDATE_WARNING = (
     "Trip %s not found for sensor update in vehicle %s"
 )
@@ -92,6 +93,9 @@ class TripLifecycle:
         """Pausa un viaje recurrente."""
         state = self._state
         if trip_id in state.recurring_trips:
+            if not get_bool(state.recurring_trips[trip_id], "activo"):
+                _LOGGER.debug(_LOG_UNCHANGED_DEBUG, trip_id, state.vehicle_id, "paused")
+                return
             state.recurring_trips[trip_id]["activo"] = False
             await state.async_save_trips()
             _LOGGER.info(_LOG_PAUSED_RECURRING_INFO, trip_id, state.vehicle_id)
@@ -107,6 +111,9 @@ class TripLifecycle:
         """Reanuda un viaje recurrente."""
         state = self._state
         if trip_id in state.recurring_trips:
+            if get_bool(state.recurring_trips[trip_id], "activo"):
+                _LOGGER.debug(_LOG_UNCHANGED_DEBUG, trip_id, state.vehicle_id, "active")
+                return
             state.recurring_trips[trip_id]["activo"] = True
             await state.async_save_trips()
             _LOGGER.info(_LOG_RESUMED_RECURRING_INFO, trip_id, state.vehicle_id)
@@ -122,6 +129,11 @@ class TripLifecycle:
         """Marca un viaje puntual como completado."""
         state = self._state
         if trip_id in state.punctual_trips:
+            if state.punctual_trips[trip_id].get("estado") == "completado":
+                _LOGGER.debug(
+                    _LOG_UNCHANGED_DEBUG, trip_id, state.vehicle_id, "completed"
+                )
+                return
             state.punctual_trips[trip_id]["estado"] = "completado"
             await state.async_save_trips()
             _LOGGER.info(_LOG_COMPLETED_PUNCTUAL_INFO, trip_id, state.vehicle_id)
@@ -138,6 +150,7 @@ class TripLifecycle:
         state = self._state
         if trip_id in state.punctual_trips:
             del state.punctual_trips[trip_id]
+            state.invalidate_trip_lists()
             await state.async_save_trips()
             _LOGGER.info(_LOG_CANCELLED_PUNCTUAL_INFO, trip_id, state.vehicle_id)
             if state.emhass_adapter:
@@ -7,6 +7,8 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
+from itertools import chain
+from operator import itemgetter
 from typing import Any, Dict, Optional
 
 from ..const import DAYS_OF_WEEK
@@ -64,8 +66,9 @@ class TripNavigator:
                     trip_hour == regreso_hour and trip_minute <= regreso_minute
                 ):
                     continue
-                trip_time = datetime.combine(
-                    hoy, datetime.strptime(trip["hora"], "%H:%M").time()
+                # Reuse the already-parsed hour/minute instead of strptime
+                trip_time = datetime(
+                    hoy.year, hoy.month, hoy.day, trip_hour, trip_minute
                 )
             except (ValueError, KeyError) as err:
                 _LOGGER.warning(
@@ -79,25 +82,27 @@ class TripNavigator:
 
         return next_trip["trip"] if next_trip else None
 
-    # CC-N-ACCEPTED: cc=11 — trip type dispatch (recurring vs punctual),
-    # state checks (active, pending), time validity, and nearest-trip
-    # selection. Same pattern as async_get_next_trip_after; each branch
-    # is a distinct domain rule with no natural grouping to reduce cc.
-    # qg-accepted: complexity=13 is inherent to next-trip selection logic
     async def async_get_next_trip(self) -> Optional[Dict[str, Any]]:
         """Get the next scheduled trip from all trips."""
         now = datetime.now(timezone.utc)
-        next_trip: Optional[Dict[str, Any]] = None
-        for trip in self._state.recurring_trips.values():
-            if get_bool(trip, "activo", True):
-                trip_time = self._state._soc._get_trip_time(trip)
-                if trip_time and trip_time > now:
-                    if next_trip is None or trip_time < next_trip["time"]:
-                        next_trip = {"time": trip_time, "trip": trip}
-        for trip in self._state.punctual_trips.values():
-            if trip.get("estado") == "pendiente":
-                trip_time = self._state._soc._get_trip_time(trip)
-                if trip_time and trip_time > now:
-                    if next_trip is None or trip_time < next_trip["time"]:
-                        next_trip = {"time": trip_time, "trip": trip}
-        return next_trip["trip"] if next_trip else None
+        get_trip_time = self._state._soc._get_trip_time
+        active_trips = chain(
+            (
+                trip
+                for trip in self._state.recurring_trips.values()
+                if get_bool(trip, "activo", True)
+            ),
+            (
+                trip
+                for trip in self._state.punctual_trips.values()
+                if trip.get("estado") == "pendiente"
+            ),
+        )
+        # Single pass; min() keeps the first of equal times (recurring wins ties)
+        upcoming = (
+            (trip_time, trip)
+            for trip in active_trips
+            if (trip_time := get_trip_time(trip)) and trip_time > now
+        )
+        nearest = min(upcoming, key=itemgetter(0), default=None)
+        return nearest[1] if nearest else None
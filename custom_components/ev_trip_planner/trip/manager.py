@@ -10,7 +10,7 @@ import logging
 from pathlib import Path  # noqa: F401
 from typing import Any, Dict, Optional
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 
 from ..emhass import EMHASSAdapter
 from ..utils import sanitize_recurring_trips as pure_sanitize_recurring_trips
@@ -102,6 +102,12 @@ class TripManager:
         self._state.emhass_adapter = value
         _LOGGER.debug(_LOG_EMHASS_ADAPTER_SET_DEBUG, self._state.vehicle_id)
 
+    # ── Change listeners ─────────────────────────────────────────
+
+    def register_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Register a callback fired whenever trip data changes. Returns a remover."""
+        return self._persistence.register_listener(update_callback)
+
     # ── Static helpers ───────────────────────────────────────────
 
     @staticmethod
@@ -7,14 +7,26 @@ No Callable fields — methods live on their respective sub-component instances.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any, Optional
 
 from homeassistant.core import HomeAssistant
 
+from ..const import DAY_INDEX, TRIP_TYPE_RECURRING
 from ..emhass import EMHASSAdapter
+from ..utils import DAY_ABBREVIATIONS
 from ..yaml_trip_storage import YamlTripStorage
 from ._sensor_callbacks import SensorCallbackRegistry
 
+# Weekday index (0=lunes) for every day name is_trip_today accepts, Spanish
+# and English, matched through their shared abbreviation.
+_WEEKDAY_BY_NAME: dict[str, int] = {
+    name: DAY_INDEX[day]
+    for day in DAY_INDEX
+    for name, abbr in DAY_ABBREVIATIONS.items()
+    if abbr == DAY_ABBREVIATIONS[day]
+}
+
 
 @dataclass
 class TripManagerState:
@@ -64,6 +76,69 @@ class TripManagerState:
     _lifecycle: Any = None  # TripLifecycle
     _soc_helpers: Any = None  # SOCHelpers
 
+    # ── Read caches ───────────────────────────────────────────────
+    # Memoized views for TripCRUD.async_get_*_trips, each paired with the
+    # dict it was built from so wholesale reassignment (load, delete_all)
+    # invalidates it implicitly. Adds/deletes call invalidate_trip_lists(),
+    # and every save does too (edits, pause/resume change day or activo).
+    # Tuples, so a caller cannot corrupt the view shared with the next one.
+    _trip_list_cache: dict[
+        str, tuple[dict[str, dict[str, Any]], tuple[dict[str, Any], ...]]
+    ] = field(default_factory=dict, repr=False)
+
+    def trip_list(self, kind: str) -> tuple[dict[str, Any], ...]:
+        """Return the memoized recurring or punctual trips.
+
+        Args:
+            kind: "recurring" or "punctual".
+        """
+        source = self.recurring_trips if kind == "recurring" else self.punctual_trips
+        cached = self._trip_list_cache.get(kind)
+        if cached is None or cached[0] is not source:
+            cached = (source, tuple(source.values()))
+            self._trip_list_cache[kind] = cached
+        return cached[1]
+
+    _weekday_index: Optional[
+        tuple[dict[str, dict[str, Any]], list[list[dict[str, Any]]]]
+    ] = field(default=None, repr=False)
+
+    def recurring_by_weekday(self) -> list[list[dict[str, Any]]]:
+        """Return active recurring trips bucketed by weekday (0=Monday).
+
+        Built once per trip-set change so "today" queries only visit
+        today's trips instead of re-parsing every trip's day name.
+        """
+        source = self.recurring_trips
+        cached = self._weekday_index
+        if cached is None or cached[0] is not source:
+            buckets: list[list[dict[str, Any]]] = [[] for _ in range(7)]
+            for trip in source.values():
+                if not trip.get("activo", True):
+                    continue
+                if trip.get("tipo") != TRIP_TYPE_RECURRING:
+                    continue
+                day = trip.get("dia", "") or trip.get("dia_semana", "")
+                weekday = _WEEKDAY_BY_NAME.get(day.lower())
+                if weekday is not None:
+                    buckets[weekday].append(trip)
+            cached = (source, buckets)
+            self._weekday_index = cached
+        return cached[1]
+
+    # Parsed punctual trip times keyed by their "datetime" string. Unlike
+    # recurring trips they don't depend on "now", so SOCHelpers parses each
+    # string once per trip-set change instead of on every refresh.
+    _punctual_time_cache: dict[Optional[str], Optional[datetime]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def invalidate_trip_lists(self) -> None:
+        """Drop memoized trip views after the trip set changed."""
+        self._trip_list_cache.clear()
+        self._weekday_index = None
+        self._punctual_time_cache.clear()
+
     # ── Delegates needed by sub-components ────────────────────────
     # Sub-components call these during operation. They are populated
     # after the sub-component is created (in TripManager.__init__).
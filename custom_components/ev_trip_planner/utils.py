@@ -34,6 +34,9 @@ DAY_ABBREVIATIONS: dict[str, str] = {
 # All possible day names (both Spanish and English)
 ALL_DAYS = set(DAY_ABBREVIATIONS.keys())
 
+# Alphabet for random ID suffixes (built once, not per generated ID)
+_SUFFIX_ALPHABET = string.ascii_lowercase + string.digits
+
 
 # qg-accepted: AP05 — standard random suffix length
 def generate_random_suffix(length: int = 6) -> str:
@@ -46,7 +49,7 @@ def generate_random_suffix(length: int = 6) -> str:
         A random lowercase string of alphanumeric characters.
     """
     return "".join(
-        random.choices(string.ascii_lowercase + string.digits, k=length)
+        random.choices(_SUFFIX_ALPHABET, k=length)
     )  # nosem: python-random-not-secure  — ID suffix, not crypto
 
 
@@ -72,6 +75,11 @@ def _generate_punctual_trip_id(
     """Generate ID for a punctual trip."""
     if isinstance(day_or_date, date):
         date_str = day_or_date.strftime("%Y%m%d")
+    elif (
+        isinstance(day_or_date, str) and len(day_or_date) == 8 and day_or_date.isdigit()
+    ):
+        # Already YYYYMMDD (what TripCRUD passes): skip the parse/format round trip
+        date_str = day_or_date
     elif isinstance(day_or_date, str):
         try:
             parsed = datetime.fromisoformat(day_or_date.replace("Z", "+00:00"))
@@ -1,5 +1,6 @@
 """Tests for TripPlannerCoordinator."""
 
+import asyncio
 import logging
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
@@ -164,7 +165,7 @@ async def test_coordinator_handles_empty_trips(
 async def test_coordinator_async_refresh_trips_calls_async_refresh(
     hass: HomeAssistant, mock_trip_manager, mock_config_entry, mock_logger
 ):
-    """Test that async_refresh_trips delegates to async_refresh."""
+    """Test that async_refresh_trips refreshes through async_refresh."""
     coordinator = TripPlannerCoordinator(
         hass,
         mock_config_entry,
@@ -172,18 +173,32 @@ async def test_coordinator_async_refresh_trips_calls_async_refresh(
         CoordinatorConfig(logger=mock_logger),
     )
 
-    refresh_called = False
+    await coordinator.async_refresh_trips()
+
+    assert coordinator.last_update_success is True
+    assert coordinator.data is not None
+    assert "recurring_trips" in coordinator.data
 
-    async def mock_refresh():
-        nonlocal refresh_called
-        refresh_called = True
 
-    coordinator.async_refresh = mock_refresh
+async def test_coordinator_async_refresh_trips_failure_fetches_once(
+    hass: HomeAssistant, mock_trip_manager, mock_config_entry, mock_logger
+):
+    """A failing refresh runs the fetch once and records the failure."""
+    coordinator = TripPlannerCoordinator(
+        hass,
+        mock_config_entry,
+        mock_trip_manager,
+        CoordinatorConfig(logger=mock_logger),
+    )
+    mock_trip_manager._crud.async_get_recurring_trips = AsyncMock(
+        side_effect=KeyError("kwh")
+    )
 
-    # Call async_refresh_trips which should delegate to async_refresh
     await coordinator.async_refresh_trips()
 
-    assert refresh_called is True
+    mock_trip_manager._crud.async_get_recurring_trips.assert_awaited_once()
+    assert coordinator.last_update_success is False
+    await coordinator.async_shutdown()
 
 
 async def test_coordinator_with_emhass_adapter_uses_cached_results(
@@ -445,12 +460,10 @@ async def test_soc_change_above_5_percent_updates_emhass_sensor_end_to_end(
 
     This test verifies the COMPLETE FLOW:
     1. PresenceMonitor detects SOC change ≥5%
-    2. Calls trip_manager.publish_deferrable_loads()
+    2. Calls trip_manager._schedule.publish_deferrable_loads()
     3. EMHASSAdapter updates its cache (power_profile, schedule, etc.)
-    4. coordinator SHOULD update coordinator.data
-    5. The EMHASS sensor SHOULD show new data
-
-    NOTE: This test documents a known bug — step 4 does not currently occur.
+    4. The publish fires the trip listeners, scheduling a coordinator refresh
+    5. coordinator.data carries the new EMHASS cache
     """
     from custom_components.ev_trip_planner.const import (
         CONF_HOME_SENSOR,
@@ -459,13 +472,19 @@ async def test_soc_change_above_5_percent_updates_emhass_sensor_end_to_end(
     )
     from custom_components.ev_trip_planner.presence_monitor import PresenceMonitor
 
-    # Setup: Create coordinator with EMHASS adapter
+    # Setup: Create coordinator with EMHASS adapter, wired like async_setup_entry
     coordinator = TripPlannerCoordinator(
         hass,
         mock_config_entry,
         mock_trip_manager,
         CoordinatorConfig(emhass_adapter=mock_emhass_adapter, logger=mock_logger),
     )
+    mock_trip_manager.emhass_adapter = mock_emhass_adapter
+    mock_trip_manager.register_listener(coordinator.async_handle_trips_changed)
+    # Run the debouncer timer on the real loop, with no cooldown
+    hass.loop = asyncio.get_running_loop()
+    hass.async_create_task = lambda coro, *args, **kwargs: asyncio.ensure_future(coro)
+    coordinator._debounced_refresh.cooldown = 0
 
     # Configure PresenceMonitor
     config = {
@@ -477,10 +496,6 @@ async def test_soc_change_above_5_percent_updates_emhass_sensor_end_to_end(
     monitor = PresenceMonitor(hass, "test_vehicle", config, mock_trip_manager)
     monitor._last_processed_soc = 50.0
 
-    # Mock publish_deferrable_loads to verify if it is called
-    mock_trip_manager._schedule = MagicMock()
-    mock_trip_manager._schedule.publish_deferrable_loads = AsyncMock()
-
     # Setup: Vehicle at home and plugged in
     mock_home_state = Mock()
     mock_home_state.state = "on"
@@ -497,69 +512,54 @@ async def test_soc_change_above_5_percent_updates_emhass_sensor_end_to_end(
     hass.states.get = mock_get_state
 
     # Setup: EMHASS adapter returns initial data (SOC 50%)
-    initial_power_profile = [3400.0, 0, 0, 0] * 42  # Initial profile
-    initial_schedule = [{"trip_id": "test", "power": 3400}]
-
+    initial_power_profile = [3400.0, 0, 0, 0] * 42
     mock_emhass_adapter.get_cached_optimization_results.return_value = {
         "emhass_power_profile": initial_power_profile,
-        "emhass_deferrables_schedule": initial_schedule,
+        "emhass_deferrables_schedule": [{"trip_id": "test", "power": 3400}],
         "emhass_status": "ready",
     }
 
     # 1. Initial coordinator refresh
     await coordinator.async_refresh()
+    assert coordinator.data["emhass_power_profile"] == initial_power_profile
 
-    # Save initial data for comparison
-    initial_coordinator_data = coordinator.data["emhass_power_profile"].copy()
+    # 2. Publishing recomputes the adapter cache (SOC 60%)
+    new_power_profile = [3600.0, 0, 0, 0] * 42
 
-    # 2. Simulate SOC change: 50% → 60% (10% delta, well above 5%)
+    async def publish(trips):
+        mock_emhass_adapter.get_cached_optimization_results.return_value = {
+            "emhass_power_profile": new_power_profile,
+            "emhass_deferrables_schedule": [{"trip_id": "test", "power": 3600}],
+            "emhass_status": "ready",
+        }
+        return True
+
+    mock_emhass_adapter.async_publish_all_deferrable_loads = AsyncMock(
+        side_effect=publish
+    )
+
+    # 3. Simulate SOC change: 50% → 60% (10% delta, well above 5%)
     old_soc_state = Mock()
     old_soc_state.state = "50"
-
     new_soc_state = Mock()
-    new_soc_state.state = "60"  # 10% change
-
+    new_soc_state.state = "60"
     event = Mock()
     event.data = {
         "old_state": old_soc_state,
         "new_state": new_soc_state,
     }
 
-    # 3. Configure EMHASS adapter to return NEW data (SOC 60%)
-    # These values will be different because the SOC changed
-    new_power_profile = [3600.0, 0, 0, 0] * 42  # Profile with SOC 60%
-    new_schedule = [{"trip_id": "test", "power": 3600}]
-
-    mock_emhass_adapter.get_cached_optimization_results.return_value = {
-        "emhass_power_profile": new_power_profile,
-        "emhass_deferrables_schedule": new_schedule,
-        "emhass_status": "ready",
-    }
-
-    # 4. Process the SOC change
     await monitor._async_handle_soc_change(event)
 
-    # VERIFICATIONS:
+    mock_emhass_adapter.async_publish_all_deferrable_loads.assert_awaited_once()
+    assert monitor._last_processed_soc == 60.0
 
-    # 1. publish_deferrable_loads() was called
-    mock_trip_manager._schedule.publish_deferrable_loads.assert_called_once()
+    # 4. The publish scheduled a debounced refresh; let its timer fire
+    await asyncio.sleep(0.05)
 
-    # 2. _last_processed_soc was updated
-    assert monitor._last_processed_soc == 60.0
+    assert coordinator.data["emhass_power_profile"] == new_power_profile
 
-    # 3. BUG: coordinator.data should update automatically
-    #    BUT it currently does NOT update because no one calls coordinator.async_refresh()
-    #
-    #    The EMHASSAdapter changed its cache (new_power_profile vs initial_power_profile)
-    #    BUT coordinator.data still has the OLD data
-    #
-    #    Verification: coordinator.data did NOT change
-    assert coordinator.data["emhass_power_profile"] == initial_coordinator_data
-    # THIS CONFIRMS THE BUG:
-    # - publish_deferrable_loads() was called ✅
-    # - The EMHASSAdapter cache changed ✅
-    # - BUT coordinator.data did NOT update ❌
-    # - Therefore, the EMHASS sensor did NOT update ❌
+    await coordinator.async_shutdown()
 
 
 @pytest.mark.asyncio
@@ -617,9 +617,3 @@ async def test_coordinator_refresh_with_updated_emhass_cache(
 
     # 4. Verify coordinator.data was updated
     assert coordinator.data["emhass_power_profile"][0] == 4000.0
-
-    # ✅ This test passes because coordinator DOES read the updated cache
-    # ❌ BUT the real issue is: WHO updates the EMHASSAdapter cache?
-    #    - PresenceMonitor calls publish_deferrable_loads() ✅
-    #    - BUT publish_deferrable_loads() does NOT call coordinator.async_refresh() ❌
-    #    - Therefore, the sensor does NOT update automatically ❌
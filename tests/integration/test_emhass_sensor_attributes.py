@@ -68,6 +68,7 @@ def mock_trip_manager():
     tm._crud.async_get_punctual_trips = AsyncMock(return_value=[])
     tm._soc_query.async_get_kwh_needed_today = AsyncMock(return_value=5.0)
     tm._soc_query.async_get_hours_needed_today = AsyncMock(return_value=2.0)
+    tm._soc_query.hours_for_kwh = MagicMock(return_value=2)
     tm._navigator.async_get_next_trip = AsyncMock(return_value=None)
 
     return tm
@@ -318,7 +318,7 @@ class TestTripUpdateHandler:
 
     @pytest.mark.asyncio
     async def test_trip_update_sensor_match(self):
-        """Handler updates sensor when trip found in recurring list."""
+        """Handler updates sensor when the trip is found by id."""
         from unittest.mock import AsyncMock, patch
 
         trip_data = {
@@ -332,7 +332,7 @@ class TestTripUpdateHandler:
             manager_cfg={
                 "async_setup": {"return_value": None},
                 "_crud.async_update_trip": {"return_value": True},
-                "_crud.async_get_recurring_trips": {"return_value": [trip_data]},
+                "_crud.async_get_trip": {"return_value": trip_data},
             }
         )
 
@@ -365,8 +365,8 @@ class TestTripUpdateHandler:
             manager_cfg={
                 "async_setup": {"return_value": None},
                 "_crud.async_update_trip": {"return_value": True},
-                "_crud.async_get_recurring_trips": {
-                    "return_value": [{"id": "rec_1", "dia_semana": "lunes"}]
+                "_crud.async_get_trip": {
+                    "return_value": {"id": "rec_1", "dia_semana": "lunes"}
                 },
             }
         )
@@ -607,15 +607,16 @@ class TestTripListHandler:
     async def test_trip_list_with_trips(self):
         hass, entry, mgr, coord = _build_hass(
             manager_cfg={
+                # The manager hands out its memoized tuples
                 "_crud.async_get_recurring_trips": {
-                    "return_value": [
+                    "return_value": (
                         {"id": "rec_1", "tipo": "recurrente", "activo": True},
-                    ],
+                    ),
                 },
                 "_crud.async_get_punctual_trips": {
-                    "return_value": [
+                    "return_value": (
                         {"id": "pun_1", "tipo": "puntual", "estado": "pendiente"},
-                    ],
+                    ),
                 },
             }
         )
@@ -628,6 +629,9 @@ class TestTripListHandler:
         assert result["total_trips"] == 2
         assert len(result["recurring_trips"]) == 1
         assert len(result["punctual_trips"]) == 1
+        # The response gets its own lists, not the shared memo
+        assert isinstance(result["recurring_trips"], list)
+        assert isinstance(result["punctual_trips"], list)
 
     @pytest.mark.asyncio
     async def test_trip_list_error(self):
@@ -657,12 +661,13 @@ class TestTripGetHandler:
     async def test_trip_get_found(self):
         hass, entry, mgr, coord = _build_hass(
             manager_cfg={
-                "_crud.async_get_recurring_trips": {
-                    "return_value": [
-                        {"id": "rec_1", "tipo": "recurrente", "dia_semana": "lunes"},
-                    ],
+                "_crud.async_get_trip": {
+                    "return_value": {
+                        "id": "rec_1",
+                        "tipo": "recurrente",
+                        "dia_semana": "lunes",
+                    },
                 },
-                "_crud.async_get_punctual_trips": {"return_value": []},
             }
         )
 
@@ -673,13 +678,13 @@ class TestTripGetHandler:
 
         assert result["found"] is True
         assert result["trip"]["id"] == "rec_1"
+        mgr._crud.async_get_trip.assert_awaited_once_with("rec_1")
 
     @pytest.mark.asyncio
     async def test_trip_get_not_found(self):
         hass, entry, mgr, coord = _build_hass(
             manager_cfg={
-                "_crud.async_get_recurring_trips": {"return_value": []},
-                "_crud.async_get_punctual_trips": {"return_value": []},
+                "_crud.async_get_trip": {"return_value": None},
             }
         )
 
@@ -693,14 +698,15 @@ class TestTripGetHandler:
 
     @pytest.mark.asyncio
     async def test_trip_get_punctual(self):
-        """Search includes punctual trips."""
+        """Lookup includes punctual trips."""
         hass, entry, mgr, coord = _build_hass(
             manager_cfg={
-                "_crud.async_get_recurring_trips": {"return_value": []},
-                "_crud.async_get_punctual_trips": {
-                    "return_value": [
-                        {"id": "pun_1", "tipo": "puntual", "datetime": "2025-12-01"},
-                    ],
+                "_crud.async_get_trip": {
+                    "return_value": {
+                        "id": "pun_1",
+                        "tipo": "puntual",
+                        "datetime": "2025-12-01",
+                    },
                 },
             }
         )
@@ -718,9 +724,7 @@ class TestTripGetHandler:
         """Manager error → returns not found with error message."""
         hass, entry, mgr, coord = _build_hass(
             manager_cfg={
-                "_crud.async_get_recurring_trips": {
-                    "side_effect": RuntimeError("fail")
-                },
+                "_crud.async_get_trip": {"side_effect": RuntimeError("fail")},
             }
         )
 
@@ -738,23 +742,11 @@ class TestImportWeeklyPatternHandler:
 
     @pytest.mark.asyncio
     async def test_import_with_clear_existing(self):
-        """Handler clears existing then imports new patterns."""
+        """Handler replaces all recurring trips in a single bulk call."""
         hass, entry, mgr, coord = _build_hass(
             manager_cfg={
                 "async_setup": {"return_value": None},
-                "_crud.async_get_recurring_trips": {
-                    "return_value": [
-                        {
-                            "id": "old_rec",
-                            "dia_semana": "lunes",
-                            "hora": "08:00",
-                            "km": 10,
-                            "kwh": 1.5,
-                        }
-                    ],
-                },
-                "_crud.async_delete_trip": {"return_value": True},
-                "_crud.async_add_recurring_trip": {"return_value": "new_rec_1"},
+                "_crud.async_replace_recurring_trips": {"return_value": None},
             }
         )
 
@@ -770,18 +762,21 @@ class TestImportWeeklyPatternHandler:
         }
         await handler(call)
 
-        # Should delete old trips
-        assert mgr._crud.async_delete_trip.called
-        # Should add new trips
-        assert mgr._crud.async_add_recurring_trip.call_count == 2
+        # One bulk replace instead of per-trip delete/add round trips
+        mgr._crud.async_replace_recurring_trips.assert_called_once()
+        trips = mgr._crud.async_replace_recurring_trips.call_args[0][0]
+        assert [t["dia_semana"] for t in trips] == ["lunes", "martes"]
+        assert not mgr._crud.async_delete_trip.called
+        assert not mgr._crud.async_add_recurring_trip.called
+        coord.async_refresh_trips.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_import_without_clear_existing(self):
-        """Handler skips clearing when clear_existing=False."""
+        """Handler appends in one bulk add when clear_existing=False."""
         hass, entry, mgr, coord = _build_hass(
             manager_cfg={
                 "async_setup": {"return_value": None},
-                "_crud.async_add_recurring_trip": {"return_value": "new_rec"},
+                "_crud.async_add_recurring_trips": {"return_value": None},
             }
         )
 
@@ -794,36 +789,20 @@ class TestImportWeeklyPatternHandler:
         }
         await handler(call)
 
-        # Should NOT delete existing
-        assert not mgr._crud.async_delete_trip.called
-        # Should add new trips
-        mgr._crud.async_add_recurring_trip.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_import_clear_fails_continues(self):
-        """Clearing existing fails → continues with import."""
-        hass, entry, mgr, coord = _build_hass(
-            manager_cfg={
-                "async_setup": {"return_value": None},
-                "_crud.async_get_recurring_trips": {
-                    "side_effect": RuntimeError("clear fail")
-                },
-                "_crud.async_add_recurring_trip": {"return_value": "new_rec"},
-            }
+        # Should NOT replace existing
+        assert not mgr._crud.async_replace_recurring_trips.called
+        mgr._crud.async_add_recurring_trips.assert_called_once_with(
+            [
+                {
+                    "dia_semana": "lunes",
+                    "hora": "09:00",
+                    "km": 24.0,
+                    "kwh": 3.6,
+                    "descripcion": "",
+                }
+            ]
         )
 
-        handler = make_import_weekly_pattern_handler(hass)
-        call = MagicMock(spec=ServiceCall)
-        call.data = {
-            "vehicle_id": "test_vehicle",
-            "clear_existing": True,
-            "pattern": {"lunes": [{"hora": "09:00", "km": 24, "kwh": 3.6}]},
-        }
-        await handler(call)
-
-        # Should have added despite clear failure
-        mgr._crud.async_add_recurring_trip.assert_called_once()
-
 
 class TestSchemas:
     """Test schema definitions."""
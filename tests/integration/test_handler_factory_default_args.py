@@ -197,8 +197,7 @@ class TestTripGetRemoveArgMutations:
         """
         hass, entry, mgr, coord = _build_hass(
             manager_cfg={
-                "_crud.async_get_recurring_trips": {"return_value": []},
-                "_crud.async_get_punctual_trips": {"return_value": []},
+                "_crud.async_get_trip": {"return_value": None},
             }
         )
 
@@ -217,8 +216,7 @@ class TestTripGetRemoveArgMutations:
         trip_data = {"id": "rec_1", "tipo": "recurrente", "dia_semana": "lunes"}
         hass, entry, mgr, coord = _build_hass(
             manager_cfg={
-                "_crud.async_get_recurring_trips": {"return_value": [trip_data]},
-                "_crud.async_get_punctual_trips": {"return_value": []},
+                "_crud.async_get_trip": {"return_value": trip_data},
             }
         )
 
@@ -240,11 +238,11 @@ class TestImportWeeklyPatternRemoveArgMutations:
 
     @pytest.mark.asyncio
     async def test_import_with_descripcion_field(self):
-        """Handler passes descripcion field to async_add_recurring_trip."""
+        """Handler passes descripcion field to async_add_recurring_trips."""
         hass, entry, mgr, coord = _build_hass(
             manager_cfg={
                 "async_setup": {"return_value": None},
-                "_crud.async_add_recurring_trip": {"return_value": "new_rec"},
+                "_crud.async_add_recurring_trips": {"return_value": None},
             }
         )
 
@@ -266,8 +264,8 @@ class TestImportWeeklyPatternRemoveArgMutations:
         }
         await handler(call)
 
-        call_args = mgr._crud.async_add_recurring_trip.call_args
-        assert call_args[1]["descripcion"] == "mi ruta"
+        trips = mgr._crud.async_add_recurring_trips.call_args[0][0]
+        assert trips[0]["descripcion"] == "mi ruta"
 
     @pytest.mark.asyncio
     async def test_import_without_descripcion_exercises_default(self):
@@ -280,7 +278,7 @@ class TestImportWeeklyPatternRemoveArgMutations:
         hass, entry, mgr, coord = _build_hass(
             manager_cfg={
                 "async_setup": {"return_value": None},
-                "_crud.async_add_recurring_trip": {"return_value": "new_rec"},
+                "_crud.async_add_recurring_trips": {"return_value": None},
             }
         )
 
@@ -296,25 +294,16 @@ class TestImportWeeklyPatternRemoveArgMutations:
         }
         await handler(call)
 
-        call_args = mgr._crud.async_add_recurring_trip.call_args
-        assert call_args[1]["descripcion"] == ""
+        trips = mgr._crud.async_add_recurring_trips.call_args[0][0]
+        assert trips[0]["descripcion"] == ""
 
     @pytest.mark.asyncio
-    async def test_import_clear_existing_exercises_delete_path(self):
-        """Handler with clear_existing=True deletes old trips before importing."""
-        old_trip = {
-            "id": "old_rec",
-            "dia_semana": "lunes",
-            "hora": "08:00",
-            "km": 10,
-            "kwh": 1.5,
-        }
+    async def test_import_clear_existing_exercises_replace_path(self):
+        """Handler with clear_existing=True replaces old trips in one call."""
         hass, entry, mgr, coord = _build_hass(
             manager_cfg={
                 "async_setup": {"return_value": None},
-                "_crud.async_get_recurring_trips": {"return_value": [old_trip]},
-                "_crud.async_delete_trip": {"return_value": True},
-                "_crud.async_add_recurring_trip": {"return_value": "new_rec"},
+                "_crud.async_replace_recurring_trips": {"return_value": None},
             }
         )
 
@@ -327,8 +316,8 @@ class TestImportWeeklyPatternRemoveArgMutations:
         }
         await handler(call)
 
-        assert mgr._crud.async_delete_trip.called
-        assert mgr._crud.async_add_recurring_trip.called
+        assert mgr._crud.async_replace_recurring_trips.called
+        assert not mgr._crud.async_add_recurring_trips.called
 
 
 class TestLifecycleHandlerRemoveArgMutations:
@@ -1,7 +1,7 @@
 """Tests for services/_utils.py shared utilities.
 
 Covers _find_entry_by_vehicle, _get_coordinator, _get_manager,
-_ensure_setup, and build_presence_config.
+and build_presence_config.
 """
 
 from __future__ import annotations
@@ -21,7 +21,6 @@ from custom_components.ev_trip_planner.const import (
     CONF_VEHICLE_COORDINATES_SENSOR,
 )
 from custom_components.ev_trip_planner.services._utils import (
-    _ensure_setup,
     _find_entry_by_vehicle,
     _get_coordinator,
     _get_manager,
@@ -244,23 +243,6 @@ class TestGetManager:
             assert result is mock_mgr
 
 
-class TestEnsureSetup:
-    """Test _ensure_setup helper."""
-
-    @pytest.mark.asyncio
-    async def test_ensure_setup_noop(self) -> None:
-        """_ensure_setup is currently a no-op and should not raise."""
-        mgr = MagicMock()
-        await _ensure_setup(mgr)
-
-    @pytest.mark.asyncio
-    async def test_ensure_setup_multiple_calls(self) -> None:
-        """Calling _ensure_setup multiple times should remain a no-op."""
-        mgr = MagicMock()
-        await _ensure_setup(mgr)
-        await _ensure_setup(mgr)
-
-
 class TestBuildPresenceConfig:
     """Test build_presence_config helper."""
 
@@ -72,6 +72,13 @@ class TestCalculateDayIndex:
 
         assert calculate_day_index(str(day_index)) == expected
 
+    def test_day_index_matches_days_of_week(self):
+        """DAY_INDEX is the reverse lookup of the DAYS_OF_WEEK tuple."""
+        from custom_components.ev_trip_planner.const import DAY_INDEX, DAYS_OF_WEEK
+
+        assert isinstance(DAYS_OF_WEEK, tuple)
+        assert {i: d for d, i in DAY_INDEX.items()} == dict(enumerate(DAYS_OF_WEEK))
+
 
 class TestCalculateTripTime:
     """Tests for calculate_trip_time."""
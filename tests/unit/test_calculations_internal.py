@@ -466,6 +466,38 @@ class TestCalculatePowerProfileFromTrips:
         # 7.4 kWh at 7.4 kW = 1 hour of charging
         assert sum(1 for v in result if v > 0) <= 2
 
+    def test_non_zero_slot_count_logged_only_at_debug(self, caplog):
+        """The non-zero slot count is only computed and logged at DEBUG."""
+        import logging
+
+        from custom_components.ev_trip_planner.calculations.power import (
+            calculate_power_profile_from_trips,
+        )
+
+        now = datetime(2026, 5, 1, 12, 0, 0, tzinfo=timezone.utc)
+        trips = [
+            {
+                "id": "t1",
+                "kwh": 7.4,
+                "datetime": (now + timedelta(hours=10)).isoformat(),
+                "tipo": "punctual",
+            }
+        ]
+        logger_name = "custom_components.ev_trip_planner.calculations.power"
+
+        with caplog.at_level(logging.INFO, logger=logger_name):
+            calculate_power_profile_from_trips(
+                trips=trips, power_kw=7.4, horizon=24, reference_dt=now
+            )
+        assert not any("non_zero" in r.getMessage() for r in caplog.records)
+
+        caplog.clear()
+        with caplog.at_level(logging.DEBUG, logger=logger_name):
+            calculate_power_profile_from_trips(
+                trips=trips, power_kw=7.4, horizon=24, reference_dt=now
+            )
+        assert any(r.getMessage() == "Final profile non_zero=1" for r in caplog.records)
+
     def test_future_deadline_creates_window(self):
         """Trip with far-future deadline creates proper window."""
         from datetime import datetime, timedelta, timezone
@@ -59,6 +59,18 @@ class TestOptionsFlowHandler:
         assert result["type"] is FlowResultType.FORM
         assert result["step_id"] == "init"
 
+    @pytest.mark.asyncio
+    async def test_form_reuses_value_validators(self):
+        """Re-rendering the form reuses validators; only defaults are rebuilt."""
+        entry = MagicMock()
+        entry.data = {}
+        entry.options = {}
+        handler = EVTripPlannerOptionsFlowHandler(entry)
+
+        first = (await handler.async_step_init())["data_schema"].schema
+        second = (await handler.async_step_init())["data_schema"].schema
+        assert all(a is b for a, b in zip(first.values(), second.values()))
+
     @pytest.mark.asyncio
     async def test_show_form_none_data(self):
         """None data → safe defaults used."""
@@ -6,16 +6,20 @@ Covers __init__, vehicle_id property, _async_update_data, and async_refresh_trip
 from __future__ import annotations
 
 import logging
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from custom_components.ev_trip_planner.coordinator import (
+    _EMPTY_TRIP_DATA,
     _LOG_REFRESH_TRIPS_DONE,
     _LOG_REFRESH_TRIPS_START,
     _LOG_UPDATE_DATA_CALLED,
     _LOG_UPDATE_DATA_RETURNING,
     _LOG_UPDATE_DATA_TRIPS_BEFORE,
+    TRIPS_CHANGED_COOLDOWN_SECONDS,
     CoordinatorConfig,
     TripPlannerCoordinator,
 )
@@ -33,6 +37,8 @@ def mock_frame_reporting():
 
 _LOGGER = logging.getLogger(__name__)
 
+_COORD_MOD = "custom_components.ev_trip_planner.coordinator"
+
 
 def _make_mock_hass():
     """Create a minimal mock HomeAssistant."""
@@ -83,6 +89,7 @@ def _make_trip_manager():
     tm._soc_query = MagicMock()
     tm._soc_query.async_get_kwh_needed_today = AsyncMock(return_value=12.5)
     tm._soc_query.async_get_hours_needed_today = AsyncMock(return_value=2.0)
+    tm._soc_query.hours_for_kwh = MagicMock(return_value=2)
     tm._navigator = MagicMock()
     tm._navigator.async_get_next_trip = AsyncMock(return_value=None)
     return tm
@@ -144,16 +151,14 @@ class TestCoordinatorInit:
         coord = _make_coordinator(vehicle_name="")
         assert coord._vehicle_id == ""
 
-    def test_init_update_interval_is_120_seconds(self):
-        """__init__ sets update_interval to timedelta(seconds=120).
+    def test_init_update_interval_is_none(self):
+        """__init__ disables polling — updates are push-driven.
 
-        This test kills mutations on the timedelta(seconds=120) value
-        that survive because tests don't assert on the update interval.
+        Trip saves notify the coordinator and a point-in-time timer covers
+        the day rollover, so no fixed update_interval is scheduled.
         """
-        from datetime import timedelta
-
         coord = _make_coordinator()
-        assert coord.update_interval == timedelta(seconds=120)
+        assert coord.update_interval is None
 
 
 class TestCoordinatorVehicleId:
@@ -194,9 +199,25 @@ class TestCoordinatorAsyncUpdateData:
         tm._crud.async_get_recurring_trips.assert_called_once()
         tm._crud.async_get_punctual_trips.assert_called_once()
         tm._soc_query.async_get_kwh_needed_today.assert_called_once()
-        tm._soc_query.async_get_hours_needed_today.assert_called_once()
+        tm._soc_query.hours_for_kwh.assert_called_once_with(12.5)
+        tm._soc_query.async_get_hours_needed_today.assert_not_called()
         tm._navigator.async_get_next_trip.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_async_update_data_logs_keys_only_at_debug(self, caplog):
+        """Returned-keys debug line is emitted at DEBUG and skipped above it."""
+        coord = _make_coordinator(emhass_adapter=None)
+        logger_name = "custom_components.ev_trip_planner.coordinator"
+
+        with caplog.at_level(logging.INFO, logger=logger_name):
+            await coord._async_update_data()
+        assert not any("keys=" in r.getMessage() for r in caplog.records)
+
+        caplog.clear()
+        with caplog.at_level(logging.DEBUG, logger=logger_name):
+            await coord._async_update_data()
+        assert any("keys=" in r.getMessage() for r in caplog.records)
+
     @pytest.mark.asyncio
     async def test_async_update_data_without_emhass(self):
         """No emhass_adapter → EMHASS keys are None."""
@@ -246,6 +267,81 @@ class TestCoordinatorAsyncUpdateData:
         assert result["recurring_trips"] == {}
         assert result["punctual_trips"] == {}
 
+    @pytest.mark.asyncio
+    async def test_async_update_data_empty_trips_skips_trip_queries(self):
+        """No trips → shared empty snapshot, kwh/next_trip queries are skipped."""
+        tm = _make_trip_manager()
+        tm._crud.async_get_recurring_trips = AsyncMock(return_value=[])
+        tm._crud.async_get_punctual_trips = AsyncMock(return_value=[])
+        coord = _make_coordinator(trip_manager=tm, emhass_adapter=None)
+        result = await coord._async_update_data()
+        tm._soc_query.async_get_kwh_needed_today.assert_not_called()
+        tm._navigator.async_get_next_trip.assert_not_called()
+        assert result["recurring_trips"] is _EMPTY_TRIP_DATA["recurring_trips"]
+        assert result["punctual_trips"] is _EMPTY_TRIP_DATA["punctual_trips"]
+        assert result["kwh_today"] == 0.0
+        assert result["hours_today"] == 0.0
+        assert result["next_trip"] is None
+        assert result["emhass_status"] is None
+
+    @pytest.mark.asyncio
+    async def test_async_update_data_raises_update_failed(self):
+        """Malformed trip data surfaces as UpdateFailed instead of a zeroed dict."""
+        tm = _make_trip_manager()
+        tm._soc_query.async_get_kwh_needed_today = AsyncMock(
+            side_effect=KeyError("kwh")
+        )
+        coord = _make_coordinator(trip_manager=tm, emhass_adapter=None)
+        with (
+            patch(f"{_COORD_MOD}.async_track_point_in_utc_time"),
+            pytest.raises(UpdateFailed, match="kwh") as exc_info,
+        ):
+            await coord._async_update_data()
+        assert isinstance(exc_info.value.__cause__, KeyError)
+
+    @pytest.mark.asyncio
+    async def test_async_update_data_failure_rearms_boundary_refresh(self):
+        """A failed fetch still leaves a boundary refresh pending."""
+        tm = _make_trip_manager()
+        tm._navigator.async_get_next_trip = AsyncMock(side_effect=ValueError("bad"))
+        coord = _make_coordinator(trip_manager=tm, emhass_adapter=None)
+        with (
+            patch(
+                f"{_COORD_MOD}.async_track_point_in_utc_time", return_value="unsub"
+            ) as mock_track,
+            pytest.raises(UpdateFailed),
+        ):
+            await coord._async_update_data()
+        mock_track.assert_called_once()
+        assert coord._unsub_boundary_refresh == "unsub"
+
+    @pytest.mark.asyncio
+    async def test_async_update_data_failure_keeps_pending_boundary(self):
+        """A failed fetch does not push back an already armed boundary."""
+        tm = _make_trip_manager()
+        tm._navigator.async_get_next_trip = AsyncMock(side_effect=ValueError("bad"))
+        coord = _make_coordinator(trip_manager=tm, emhass_adapter=None)
+        pending = MagicMock()
+        coord._unsub_boundary_refresh = pending
+        with (
+            patch(f"{_COORD_MOD}.async_track_point_in_utc_time") as mock_track,
+            pytest.raises(UpdateFailed),
+        ):
+            await coord._async_update_data()
+        mock_track.assert_not_called()
+        pending.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_update_data_programming_errors_propagate(self):
+        """Errors other than malformed trip data are not wrapped."""
+        tm = _make_trip_manager()
+        tm._soc_query.async_get_kwh_needed_today = AsyncMock(
+            side_effect=RuntimeError("boom")
+        )
+        coord = _make_coordinator(trip_manager=tm, emhass_adapter=None)
+        with pytest.raises(RuntimeError, match="boom"):
+            await coord._async_update_data()
+
     @pytest.mark.asyncio
     async def test_async_update_data_punctual_trips_included(self):
         """Punctual trips are included alongside recurring trips."""
@@ -272,10 +368,9 @@ class TestCoordinatorRefreshTrips:
     async def test_async_refresh_trips_calls_parent_refresh(self):
         """async_refresh_trips delegates to async_refresh()."""
         coord = _make_coordinator()
-        # async_refresh is a DataUpdateCoordinator method — mock it
-        coord.async_refresh = AsyncMock(return_value=MagicMock())
+        coord.async_refresh = AsyncMock()
         await coord.async_refresh_trips()
-        coord.async_refresh.assert_called_once()
+        coord.async_refresh.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_async_refresh_trips_with_existing_data(self):
@@ -283,18 +378,98 @@ class TestCoordinatorRefreshTrips:
         coord = _make_coordinator()
         # Pre-populate self.data to simulate prior _async_update_data run
         coord.data = {"recurring_trips": {}, "punctual_trips": {}, "kwh_today": 0.0}
-        coord.async_refresh = AsyncMock(return_value=MagicMock())
+        coord.async_refresh = AsyncMock()
         await coord.async_refresh_trips()
-        coord.async_refresh.assert_called_once()
+        coord.async_refresh.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_async_refresh_trips_with_none_data(self):
         """async_refresh_trips handles None data gracefully."""
         coord = _make_coordinator()
         coord.data = None
-        coord.async_refresh = AsyncMock(return_value=MagicMock())
+        coord.async_refresh = AsyncMock()
         await coord.async_refresh_trips()
-        coord.async_refresh.assert_called_once()
+        coord.async_refresh.assert_awaited_once()
+
+
+class TestCoordinatorPushUpdates:
+    """Test push-driven refresh: trip change listener and boundary timer."""
+
+    def test_handle_trips_changed_requests_refresh(self):
+        """async_handle_trips_changed schedules a debounced refresh."""
+        coord = _make_coordinator()
+        coord._debounced_refresh = MagicMock()
+        coord.async_handle_trips_changed()
+        coord._debounced_refresh.async_schedule_call.assert_called_once()
+
+    def test_trips_changed_debouncer_is_trailing_edge(self):
+        """Save-triggered refreshes wait out the cooldown so handlers can cancel."""
+        coord = _make_coordinator()
+        assert coord._debounced_refresh.immediate is False
+        assert coord._debounced_refresh.cooldown == TRIPS_CHANGED_COOLDOWN_SECONDS
+
+    def test_boundary_refresh_defaults_to_next_utc_midnight(self):
+        """Without a next trip, the refresh is scheduled at next UTC midnight."""
+        coord = _make_coordinator()
+        now = datetime(2026, 3, 10, 15, 30, tzinfo=timezone.utc)
+        with (
+            patch(f"{_COORD_MOD}.dt_util.utcnow", return_value=now),
+            patch(f"{_COORD_MOD}.async_track_point_in_utc_time") as mock_track,
+        ):
+            coord._async_schedule_boundary_refresh(None)
+        assert mock_track.call_args[0][2] == datetime(2026, 3, 11, tzinfo=timezone.utc)
+
+    def test_boundary_refresh_uses_earlier_next_trip(self):
+        """A next trip departing before midnight moves the boundary earlier."""
+        tm = _make_trip_manager()
+        departure = datetime(2026, 3, 10, 18, 0, tzinfo=timezone.utc)
+        tm._soc_query._get_trip_time = MagicMock(return_value=departure)
+        coord = _make_coordinator(trip_manager=tm)
+        now = datetime(2026, 3, 10, 15, 30, tzinfo=timezone.utc)
+        with (
+            patch(f"{_COORD_MOD}.dt_util.utcnow", return_value=now),
+            patch(f"{_COORD_MOD}.async_track_point_in_utc_time") as mock_track,
+        ):
+            coord._async_schedule_boundary_refresh({"id": "rec_1"})
+        assert mock_track.call_args[0][2] == departure
+
+    def test_boundary_refresh_cancels_previous_timer(self):
+        """Rescheduling cancels the previously armed timer."""
+        coord = _make_coordinator()
+        previous = MagicMock()
+        coord._unsub_boundary_refresh = previous
+        with patch(
+            f"{_COORD_MOD}.async_track_point_in_utc_time", return_value="new_unsub"
+        ):
+            coord._async_schedule_boundary_refresh(None)
+        previous.assert_called_once()
+        assert coord._unsub_boundary_refresh == "new_unsub"
+
+    @pytest.mark.asyncio
+    async def test_boundary_handler_refreshes(self):
+        """Boundary timer firing refreshes and always leaves a timer armed."""
+        coord = _make_coordinator()
+        coord._unsub_boundary_refresh = MagicMock()
+        coord.async_refresh = AsyncMock()
+        coord._async_schedule_boundary_refresh = MagicMock()
+        await coord._async_handle_boundary_refresh(MagicMock())
+        coord.async_refresh.assert_awaited_once()
+        # Nothing re-armed it (mocked refresh), so the fallback timer is set
+        coord._async_schedule_boundary_refresh.assert_called_once_with(None)
+
+    @pytest.mark.asyncio
+    async def test_boundary_handler_keeps_timer_armed_by_refresh(self):
+        """A refresh that armed the next boundary is not rescheduled again."""
+        coord = _make_coordinator()
+
+        async def _refresh():
+            coord._unsub_boundary_refresh = "armed_by_refresh"
+
+        coord.async_refresh = AsyncMock(side_effect=_refresh)
+        coord._async_schedule_boundary_refresh = MagicMock()
+        await coord._async_handle_boundary_refresh(MagicMock())
+        coord._async_schedule_boundary_refresh.assert_not_called()
+        assert coord._unsub_boundary_refresh == "armed_by_refresh"
 
 
 # ---------- US-5: Log string constant tests ----------
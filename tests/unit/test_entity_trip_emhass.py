@@ -53,6 +53,7 @@ def _make_coordinator():
     tm._crud.async_get_punctual_trips = AsyncMock(return_value=[])
     tm._soc_query.async_get_kwh_needed_today = AsyncMock(return_value=12.5)
     tm._soc_query.async_get_hours_needed_today = AsyncMock(return_value=2.0)
+    tm._soc_query.hours_for_kwh = MagicMock(return_value=2)
     tm._navigator.async_get_next_trip = AsyncMock(return_value=None)
     config = CoordinatorConfig(emhass_adapter=None)
     coord = TripPlannerCoordinator(
@@ -81,6 +81,54 @@ class TestTripPlannerSensorExtraStateAttributesNone:
         assert sensor.extra_state_attributes == {}
 
 
+class TestTripPlannerSensorSnapshotCache:
+    """Test value_fn/attrs_fn run once per coordinator.data snapshot."""
+
+    def _make_counting_sensor(self, coordinator):
+        from custom_components.ev_trip_planner.definitions import (
+            TripSensorEntityDescription,
+        )
+
+        value_fn = MagicMock(side_effect=lambda data: data["n"])
+        attrs_fn = MagicMock(side_effect=lambda data: {"n": data["n"]})
+        desc = TripSensorEntityDescription(
+            key="counting", value_fn=value_fn, attrs_fn=attrs_fn
+        )
+        return TripPlannerSensor(coordinator, "test_vehicle", desc), value_fn, attrs_fn
+
+    def test_repeated_reads_reuse_cached_results(self):
+        """Reading state repeatedly for the same snapshot calls each fn once."""
+        coordinator = _make_coordinator()
+        coordinator.data = {"n": 1}
+        sensor, value_fn, attrs_fn = self._make_counting_sensor(coordinator)
+        for _ in range(3):
+            assert sensor.native_value == 1
+            assert sensor.extra_state_attributes == {"n": 1}
+        assert value_fn.call_count == 1
+        assert attrs_fn.call_count == 1
+
+    def test_new_snapshot_recomputes(self):
+        """A replaced coordinator.data dict is re-evaluated."""
+        coordinator = _make_coordinator()
+        coordinator.data = {"n": 1}
+        sensor, value_fn, _ = self._make_counting_sensor(coordinator)
+        assert sensor.native_value == 1
+        coordinator.data = {"n": 2}
+        assert sensor.native_value == 2
+        assert sensor.extra_state_attributes == {"n": 2}
+        assert value_fn.call_count == 2
+
+    def test_cached_attributes_are_read_only(self):
+        """The shared attributes mapping cannot be mutated by a reader."""
+        coordinator = _make_coordinator()
+        coordinator.data = {"n": 1}
+        sensor, _, _ = self._make_counting_sensor(coordinator)
+        attrs = sensor.extra_state_attributes
+        with pytest.raises(TypeError):
+            attrs["n"] = 2  # type: ignore[index]
+        assert sensor.extra_state_attributes == {"n": 1}
+
+
 class TestTripPlannerSensorDeviceInfo:
     """Test device_info property (line 93-101)."""
 
@@ -50,11 +50,14 @@ def _make_manager():
     mgr = MagicMock()
     mgr._crud = MagicMock()
     mgr._crud.async_add_recurring_trip = AsyncMock()
+    mgr._crud.async_add_recurring_trips = AsyncMock()
+    mgr._crud.async_replace_recurring_trips = AsyncMock()
     mgr._crud.async_add_punctual_trip = AsyncMock()
     mgr._crud.async_update_trip = AsyncMock()
     mgr._crud.async_delete_trip = AsyncMock()
     mgr._crud.async_get_recurring_trips = AsyncMock(return_value=[])
     mgr._crud.async_get_punctual_trips = AsyncMock(return_value=[])
+    mgr._crud.async_get_trip = AsyncMock(return_value=None)
     mgr._lifecycle = MagicMock()
     mgr._lifecycle.async_pause_recurring_trip = AsyncMock()
     mgr._lifecycle.async_resume_recurring_trip = AsyncMock()
@@ -306,72 +309,66 @@ class TestImportWeeklyPattern:
 
     @pytest.mark.asyncio
     async def test_import_clears_existing_and_imports_pattern(self):
-        """Lines 378-410: Handler clears existing and imports new pattern."""
+        """clear_existing=True replaces the recurring set in one call."""
         hass = MagicMock()
         handler = make_import_weekly_pattern_handler(hass)
 
         mgr = _make_manager()
-        mgr._crud.async_get_recurring_trips = AsyncMock(
-            return_value=[{"id": "old_trip"}]
-        )
-        mgr._crud.async_delete_trip = AsyncMock()
 
         with patch(
             "custom_components.ev_trip_planner.services._handler_factories._get_manager",
             new=AsyncMock(return_value=mgr),
         ):
-            with patch(
-                "custom_components.ev_trip_planner.services._handler_factories._ensure_setup",
-                new=AsyncMock(),
-            ):
-                call = _make_call(
-                    {
-                        "vehicle_id": "test_vehicle",
-                        "clear_existing": True,
-                        "pattern": {
-                            "1": [{"hora": "08:00", "km": 30.0, "kwh": 5.0}],
-                        },
-                    }
-                )
-                await handler(call)
+            call = _make_call(
+                {
+                    "vehicle_id": "test_vehicle",
+                    "clear_existing": True,
+                    "pattern": {
+                        "1": [{"hora": "08:00", "km": 30.0, "kwh": 5.0}],
+                    },
+                }
+            )
+            await handler(call)
 
-        mgr._crud.async_delete_trip.assert_called_once()
-        mgr._crud.async_add_recurring_trip.assert_called_once()
+        mgr._crud.async_replace_recurring_trips.assert_called_once_with(
+            [
+                {
+                    "dia_semana": "1",
+                    "hora": "08:00",
+                    "km": 30.0,
+                    "kwh": 5.0,
+                    "descripcion": "",
+                }
+            ]
+        )
+        mgr._crud.async_delete_trip.assert_not_called()
+        mgr._crud.async_add_recurring_trip.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_import_skips_clear_on_exception(self):
-        """Lines 390-393: Exception during get_recurring_trips → existing=[] (skips clear)."""
+    async def test_import_appends_without_clear(self):
+        """clear_existing=False appends the pattern in one bulk add."""
         hass = MagicMock()
         handler = make_import_weekly_pattern_handler(hass)
 
         mgr = _make_manager()
-        mgr._crud.async_get_recurring_trips = AsyncMock(
-            side_effect=Exception("DB error")
-        )
-        mgr._crud.async_delete_trip = AsyncMock()
 
         with patch(
             "custom_components.ev_trip_planner.services._handler_factories._get_manager",
             new=AsyncMock(return_value=mgr),
         ):
-            with patch(
-                "custom_components.ev_trip_planner.services._handler_factories._ensure_setup",
-                new=AsyncMock(),
-            ):
-                call = _make_call(
-                    {
-                        "vehicle_id": "test_vehicle",
-                        "clear_existing": True,
-                        "pattern": {
-                            "1": [{"hora": "08:00", "km": 30.0, "kwh": 5.0}],
-                        },
-                    }
-                )
-                await handler(call)
+            call = _make_call(
+                {
+                    "vehicle_id": "test_vehicle",
+                    "clear_existing": False,
+                    "pattern": {
+                        "1": [{"hora": "08:00", "km": 30.0, "kwh": 5.0}],
+                    },
+                }
+            )
+            await handler(call)
 
-        # Should NOT call delete_trip since existing=[] after exception
-        mgr._crud.async_delete_trip.assert_not_called()
-        mgr._crud.async_add_recurring_trip.assert_called_once()
+        mgr._crud.async_replace_recurring_trips.assert_not_called()
+        mgr._crud.async_add_recurring_trips.assert_called_once()
 
 
 class TestTripList:
@@ -436,10 +433,9 @@ class TestTripGet:
         handler = make_trip_get_handler(hass)
 
         mgr = _make_manager()
-        mgr._crud.async_get_recurring_trips = AsyncMock(
-            return_value=[{"id": "123", "tipo": "recurrente", "activo": True}]
+        mgr._crud.async_get_trip = AsyncMock(
+            return_value={"id": "123", "tipo": "recurrente", "activo": True}
         )
-        mgr._crud.async_get_punctual_trips = AsyncMock(return_value=[])
 
         with patch(
             "custom_components.ev_trip_planner.services._handler_factories._get_manager",
@@ -458,8 +454,6 @@ class TestTripGet:
         handler = make_trip_get_handler(hass)
 
         mgr = _make_manager()
-        mgr._crud.async_get_recurring_trips = AsyncMock(return_value=[])
-        mgr._crud.async_get_punctual_trips = AsyncMock(return_value=[])
 
         with patch(
             "custom_components.ev_trip_planner.services._handler_factories._get_manager",
@@ -493,18 +487,14 @@ class TestEditTrip:
                 "custom_components.ev_trip_planner.services._handler_factories._get_coordinator",
                 return_value=coordinator,
             ):
-                with patch(
-                    "custom_components.ev_trip_planner.services._handler_factories._ensure_setup",
-                    new=AsyncMock(),
-                ):
-                    call = _make_call(
-                        {
-                            "vehicle_id": "test_vehicle",
-                            "trip_id": "123",
-                            "updates": {"km": 40.0},
-                        }
-                    )
-                    await handler(call)
+                call = _make_call(
+                    {
+                        "vehicle_id": "test_vehicle",
+                        "trip_id": "123",
+                        "updates": {"km": 40.0},
+                    }
+                )
+                await handler(call)
 
         mgr._crud.async_update_trip.assert_called_once()
         coordinator.async_refresh_trips.assert_called_once()
@@ -534,21 +524,17 @@ class TestTripUpdateDescripcion:
                 return_value=coordinator,
             ):
                 with patch(
-                    "custom_components.ev_trip_planner.services._handler_factories._ensure_setup",
-                    new=AsyncMock(),
+                    "custom_components.ev_trip_planner.services._handler_factories._find_entry_by_vehicle",
+                    return_value=entry,
                 ):
-                    with patch(
-                        "custom_components.ev_trip_planner.services._handler_factories._find_entry_by_vehicle",
-                        return_value=entry,
-                    ):
-                        call = _make_call(
-                            {
-                                "vehicle_id": "test_vehicle",
-                                "trip_id": "123",
-                                "descripcion": "Test description",
-                            }
-                        )
-                        await handler(call)
+                    call = _make_call(
+                        {
+                            "vehicle_id": "test_vehicle",
+                            "trip_id": "123",
+                            "descripcion": "Test description",
+                        }
+                    )
+                    await handler(call)
 
         # Verify descripcion was set in updates
         call_args = mgr._crud.async_update_trip.call_args
@@ -576,21 +562,17 @@ class TestTripUpdateDescripcion:
                 return_value=coordinator,
             ):
                 with patch(
-                    "custom_components.ev_trip_planner.services._handler_factories._ensure_setup",
-                    new=AsyncMock(),
+                    "custom_components.ev_trip_planner.services._handler_factories._find_entry_by_vehicle",
+                    return_value=entry,
                 ):
-                    with patch(
-                        "custom_components.ev_trip_planner.services._handler_factories._find_entry_by_vehicle",
-                        return_value=entry,
-                    ):
-                        call = _make_call(
-                            {
-                                "vehicle_id": "test_vehicle",
-                                "trip_id": "123",
-                                "description": "English description",
-                            }
-                        )
-                        await handler(call)
+                    call = _make_call(
+                        {
+                            "vehicle_id": "test_vehicle",
+                            "trip_id": "123",
+                            "description": "English description",
+                        }
+                    )
+                    await handler(call)
 
         # Verify description was mapped to descripcion in updates
         call_args = mgr._crud.async_update_trip.call_args
@@ -622,21 +604,17 @@ class TestTripUpdateWithUpdatesDict:
                 return_value=coordinator,
             ):
                 with patch(
-                    "custom_components.ev_trip_planner.services._handler_factories._ensure_setup",
-                    new=AsyncMock(),
+                    "custom_components.ev_trip_planner.services._handler_factories._find_entry_by_vehicle",
+                    return_value=entry,
                 ):
-                    with patch(
-                        "custom_components.ev_trip_planner.services._handler_factories._find_entry_by_vehicle",
-                        return_value=entry,
-                    ):
-                        call = _make_call(
-                            {
-                                "vehicle_id": "test_vehicle",
-                                "trip_id": "123",
-                                "updates": {"km": 50.0, "dia_semana": "martes"},
-                            }
-                        )
-                        await handler(call)
+                    call = _make_call(
+                        {
+                            "vehicle_id": "test_vehicle",
+                            "trip_id": "123",
+                            "updates": {"km": 50.0, "dia_semana": "martes"},
+                        }
+                    )
+                    await handler(call)
 
         # Verify updates dict was passed directly
         mgr._crud.async_update_trip.assert_called_once()
@@ -657,16 +635,14 @@ class TestTripUpdateSensorUpdate:
 
         mgr = _make_manager()
         mgr._crud.async_update_trip = AsyncMock()
-        mgr._crud.async_get_recurring_trips = AsyncMock(
-            return_value=[
-                {
-                    "id": "123",
-                    "dia_semana": "lunes",
-                    "hora": "08:00",
-                    "km": 30.0,
-                    "kwh": 5.0,
-                }
-            ]
+        mgr._crud.async_get_trip = AsyncMock(
+            return_value={
+                "id": "123",
+                "dia_semana": "lunes",
+                "hora": "08:00",
+                "km": 30.0,
+                "kwh": 5.0,
+            }
         )
 
         coordinator = MagicMock()
@@ -685,27 +661,23 @@ class TestTripUpdateSensorUpdate:
                 return_value=coordinator,
             ):
                 with patch(
-                    "custom_components.ev_trip_planner.services._handler_factories._ensure_setup",
-                    new=AsyncMock(),
+                    "custom_components.ev_trip_planner.services._handler_factories._find_entry_by_vehicle",
+                    return_value=entry,
                 ):
                     with patch(
-                        "custom_components.ev_trip_planner.services._handler_factories._find_entry_by_vehicle",
-                        return_value=entry,
+                        "custom_components.ev_trip_planner.sensor.async_update_trip_sensor",
+                        mock_async_update,
                     ):
-                        with patch(
-                            "custom_components.ev_trip_planner.sensor.async_update_trip_sensor",
-                            mock_async_update,
-                        ):
-                            call = _make_call(
-                                {
-                                    "vehicle_id": "test_vehicle",
-                                    "trip_id": "123",
-                                    "dia_semana": "lunes",
-                                    "hora": "09:00",
-                                    "km": 35.0,
-                                }
-                            )
-                            await handler(call)
+                        call = _make_call(
+                            {
+                                "vehicle_id": "test_vehicle",
+                                "trip_id": "123",
+                                "dia_semana": "lunes",
+                                "hora": "09:00",
+                                "km": 35.0,
+                            }
+                        )
+                        await handler(call)
 
         mock_async_update.assert_called_once()
         call_args = mock_async_update.call_args
@@ -723,7 +695,7 @@ class TestTripGetException:
         handler = make_trip_get_handler(hass)
 
         mgr = _make_manager()
-        mgr._crud.async_get_recurring_trips = AsyncMock(
+        mgr._crud.async_get_trip = AsyncMock(
             side_effect=RuntimeError("Database connection failed")
         )
 
@@ -865,16 +837,14 @@ class TestTripUpdateSensorException:
 
         mgr = _make_manager()
         mgr._crud.async_update_trip = AsyncMock()
-        mgr._crud.async_get_recurring_trips = AsyncMock(
-            return_value=[
-                {
-                    "id": "123",
-                    "dia_semana": "lunes",
-                    "hora": "08:00",
-                    "km": 30.0,
-                    "kwh": 5.0,
-                }
-            ]
+        mgr._crud.async_get_trip = AsyncMock(
+            return_value={
+                "id": "123",
+                "dia_semana": "lunes",
+                "hora": "08:00",
+                "km": 30.0,
+                "kwh": 5.0,
+            }
         )
 
         coordinator = MagicMock()
@@ -893,26 +863,22 @@ class TestTripUpdateSensorException:
                 return_value=coordinator,
             ):
                 with patch(
-                    "custom_components.ev_trip_planner.services._handler_factories._ensure_setup",
-                    new=AsyncMock(),
+                    "custom_components.ev_trip_planner.services._handler_factories._find_entry_by_vehicle",
+                    return_value=entry,
                 ):
                     with patch(
-                        "custom_components.ev_trip_planner.services._handler_factories._find_entry_by_vehicle",
-                        return_value=entry,
+                        "custom_components.ev_trip_planner.sensor.async_update_trip_sensor",
+                        mock_async_update,
                     ):
-                        with patch(
-                            "custom_components.ev_trip_planner.sensor.async_update_trip_sensor",
-                            mock_async_update,
-                        ):
-                            call = _make_call(
-                                {
-                                    "vehicle_id": "test_vehicle",
-                                    "trip_id": "123",
-                                    "km": 35.0,
-                                }
-                            )
-                            # Should NOT raise - exception is caught
-                            await handler(call)
+                        call = _make_call(
+                            {
+                                "vehicle_id": "test_vehicle",
+                                "trip_id": "123",
+                                "km": 35.0,
+                            }
+                        )
+                        # Should NOT raise - exception is caught
+                        await handler(call)
 
         # Update still happened despite sensor failure
         mgr._crud.async_update_trip.assert_called_once()
@@ -1000,23 +966,19 @@ class TestTripCreateWithDayOfWeek:
                 return_value=coordinator,
             ):
                 with patch(
-                    "custom_components.ev_trip_planner.services._handler_factories._ensure_setup",
-                    new=AsyncMock(),
+                    "custom_components.ev_trip_planner.services._handler_factories._find_entry_by_vehicle",
+                    return_value=entry,
                 ):
-                    with patch(
-                        "custom_components.ev_trip_planner.services._handler_factories._find_entry_by_vehicle",
-                        return_value=entry,
-                    ):
-                        call = _make_call(
-                            {
-                                "vehicle_id": "test_vehicle",
-                                "trip_id": "123",
-                                "dia_semana": "lunes",
-                                "hora": "09:00",
-                                "km": 30.0,
-                                "kwh": 5.0,
-                            }
-                        )
-                        await handler(call)
+                    call = _make_call(
+                        {
+                            "vehicle_id": "test_vehicle",
+                            "trip_id": "123",
+                            "dia_semana": "lunes",
+                            "hora": "09:00",
+                            "km": 30.0,
+                            "kwh": 5.0,
+                        }
+                    )
+                    await handler(call)
 
         mgr._crud.async_update_trip.assert_called_once()
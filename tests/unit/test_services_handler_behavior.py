@@ -23,6 +23,7 @@ def mock_mgr():
     mgr._crud = MagicMock()
     mgr._crud.async_get_recurring_trips = AsyncMock(return_value=[])
     mgr._crud.async_get_punctual_trips = AsyncMock(return_value=[])
+    mgr._crud.async_get_trip = AsyncMock(return_value=None)
     mgr._state = MagicMock()
     mgr._state.recurring_trips = []
     mgr._state.punctual_trips = []
@@ -120,6 +121,38 @@ class TestMakeTripListHandler:
         assert result["recurring_trips"] == [{"id": "r1"}, {"id": "r2"}]
         assert result["punctual_trips"] == [{"id": "p1"}]
 
+    @pytest.mark.asyncio
+    async def test_per_trip_debug_dump_only_when_debug_enabled(
+        self, mock_hass, mock_mgr, caplog
+    ):
+        """Per-trip entry logs are emitted at DEBUG and skipped above it."""
+        import logging
+
+        from custom_components.ev_trip_planner.services._handler_factories import (
+            make_trip_list_handler,
+        )
+
+        mock_mgr._crud.async_get_recurring_trips = AsyncMock(
+            return_value=[{"id": "r1", "tipo": "recurrente", "activo": True}]
+        )
+        mock_mgr._crud.async_get_punctual_trips = AsyncMock(
+            return_value=[{"id": "p1", "tipo": "puntual", "estado": "pendiente"}]
+        )
+        handler = make_trip_list_handler(mock_hass)
+        call = _make_service_call({"vehicle_id": "test_vehicle"})
+        logger_name = "custom_components.ev_trip_planner.services._handler_factories"
+
+        with caplog.at_level(logging.INFO, logger=logger_name):
+            await handler(call)
+        assert not any(r.levelno == logging.DEBUG for r in caplog.records)
+
+        caplog.clear()
+        with caplog.at_level(logging.DEBUG, logger=logger_name):
+            await handler(call)
+        messages = {r.getMessage() for r in caplog.records}
+        assert "Recurring trip 0: id=r1, tipo=recurrente, activo=True" in messages
+        assert any(m.startswith("Punctual trip 0: id=p1") for m in messages)
+
     @pytest.mark.asyncio
     async def test_handles_vehicle_id_from_data(self, mock_hass, mock_mgr):
         """Kill mutations: data.get("vehicle_id", "unknown") → data.get(None, "unknown")."""
@@ -205,10 +238,9 @@ class TestMakeTripGetHandler:
             make_trip_get_handler,
         )
 
-        mock_mgr._crud.async_get_recurring_trips = AsyncMock(
-            return_value=[{"id": "trip_123", "type": "recurrente"}]
+        mock_mgr._crud.async_get_trip = AsyncMock(
+            return_value={"id": "trip_123", "type": "recurrente"}
         )
-        mock_mgr._crud.async_get_punctual_trips = AsyncMock(return_value=[])
 
         handler = make_trip_get_handler(mock_hass)
         call = _make_service_call(
@@ -230,8 +262,7 @@ class TestMakeTripGetHandler:
             make_trip_get_handler,
         )
 
-        mock_mgr._crud.async_get_recurring_trips = AsyncMock(return_value=[])
-        mock_mgr._crud.async_get_punctual_trips = AsyncMock(return_value=[])
+        mock_mgr._crud.async_get_trip = AsyncMock(return_value=None)
 
         handler = make_trip_get_handler(mock_hass)
         call = _make_service_call(
@@ -255,8 +286,7 @@ class TestMakeTripGetHandler:
         )
 
         trip_data = {"id": "t1", "dia_semana": "lunes", "hora": "08:00"}
-        mock_mgr._crud.async_get_recurring_trips = AsyncMock(return_value=[trip_data])
-        mock_mgr._crud.async_get_punctual_trips = AsyncMock(return_value=[])
+        mock_mgr._crud.async_get_trip = AsyncMock(return_value=trip_data)
 
         handler = make_trip_get_handler(mock_hass)
         call = _make_service_call(
@@ -277,9 +307,7 @@ class TestMakeTripGetHandler:
             make_trip_get_handler,
         )
 
-        mock_mgr._crud.async_get_recurring_trips = AsyncMock(
-            side_effect=RuntimeError("db error")
-        )
+        mock_mgr._crud.async_get_trip = AsyncMock(side_effect=RuntimeError("db error"))
 
         handler = make_trip_get_handler(mock_hass)
         call = _make_service_call(
@@ -296,19 +324,13 @@ class TestMakeTripGetHandler:
         assert "db error" in result.get("error", "")
 
     @pytest.mark.asyncio
-    async def test_searches_recurring_then_punctual(self, mock_hass, mock_mgr):
-        """Kill mutations: search order reversed (punctual→recurring)."""
+    async def test_looks_up_trip_by_id(self, mock_hass, mock_mgr):
+        """Kill mutations: trip_id not passed or lists scanned instead."""
         from custom_components.ev_trip_planner.services._handler_factories import (
             make_trip_get_handler,
         )
 
-        # Trip exists in recurring
-        mock_mgr._crud.async_get_recurring_trips = AsyncMock(
-            return_value=[{"id": "rec_1"}]
-        )
-        mock_mgr._crud.async_get_punctual_trips = AsyncMock(
-            return_value=[{"id": "punc_1"}]
-        )
+        mock_mgr._crud.async_get_trip = AsyncMock(return_value={"id": "rec_1"})
 
         handler = make_trip_get_handler(mock_hass)
         call = _make_service_call(
@@ -322,23 +344,23 @@ class TestMakeTripGetHandler:
 
         assert result["found"] is True
         assert result["trip"]["id"] == "rec_1"
+        mock_mgr._crud.async_get_trip.assert_awaited_once_with("rec_1")
+        mock_mgr._crud.async_get_recurring_trips.assert_not_called()
+        mock_mgr._crud.async_get_punctual_trips.assert_not_called()
 
 
 class TestMakeImportWeeklyPatternHandler:
     """Targets 32 survivors in make_import_weekly_pattern_handler."""
 
     @pytest.mark.asyncio
-    async def test_clear_existing_deletes_trips(self, mock_hass, mock_mgr):
-        """Kill mutations: clear_existing=True skips deletion or uses wrong trip_id."""
+    async def test_clear_existing_replaces_trips(self, mock_hass, mock_mgr):
+        """Kill mutations: clear_existing=True skips replacement or drops trips."""
         from custom_components.ev_trip_planner.services._handler_factories import (
             make_import_weekly_pattern_handler,
         )
 
-        mock_mgr._crud.async_get_recurring_trips = AsyncMock(
-            return_value=[{"id": "old_1"}, {"id": "old_2"}]
-        )
-        mock_mgr._crud.async_delete_trip = AsyncMock()
-        mock_mgr._crud.async_add_recurring_trip = AsyncMock()
+        mock_mgr._crud.async_replace_recurring_trips = AsyncMock()
+        mock_mgr._crud.async_add_recurring_trips = AsyncMock()
 
         handler = make_import_weekly_pattern_handler(mock_hass)
         call = _make_service_call(
@@ -351,20 +373,28 @@ class TestMakeImportWeeklyPatternHandler:
 
         await handler(call)
 
-        # Should delete all existing trips before adding new ones
-        assert mock_mgr._crud.async_delete_trip.call_count == 2
-        mock_mgr._crud.async_delete_trip.assert_any_call("old_1")
-        mock_mgr._crud.async_delete_trip.assert_any_call("old_2")
+        # Existing trips are swapped out in a single call, not one by one
+        mock_mgr._crud.async_replace_recurring_trips.assert_called_once_with(
+            [
+                {
+                    "dia_semana": "monday",
+                    "hora": "08:00",
+                    "km": 10.0,
+                    "kwh": 1.0,
+                    "descripcion": "",
+                }
+            ]
+        )
+        mock_mgr._crud.async_add_recurring_trips.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_imports_pattern_trips(self, mock_hass, mock_mgr):
-        """Kill mutations: async_add_recurring_trip → None or wrong args."""
+        """Kill mutations: async_add_recurring_trips → None or wrong args."""
         from custom_components.ev_trip_planner.services._handler_factories import (
             make_import_weekly_pattern_handler,
         )
 
-        mock_mgr._crud.async_get_recurring_trips = AsyncMock(return_value=[])
-        mock_mgr._crud.async_add_recurring_trip = AsyncMock()
+        mock_mgr._crud.async_add_recurring_trips = AsyncMock()
 
         handler = make_import_weekly_pattern_handler(mock_hass)
         call = _make_service_call(
@@ -382,7 +412,9 @@ class TestMakeImportWeeklyPatternHandler:
 
         await handler(call)
 
-        assert mock_mgr._crud.async_add_recurring_trip.call_count == 2
+        mock_mgr._crud.async_add_recurring_trips.assert_called_once()
+        trips = mock_mgr._crud.async_add_recurring_trips.call_args[0][0]
+        assert [t["hora"] for t in trips] == ["08:00", "18:00"]
 
     @pytest.mark.asyncio
     async def test_default_clear_existing_is_true(self, mock_hass, mock_mgr):
@@ -391,10 +423,8 @@ class TestMakeImportWeeklyPatternHandler:
             make_import_weekly_pattern_handler,
         )
 
-        mock_mgr._crud.async_get_recurring_trips = AsyncMock(
-            return_value=[{"id": "should_delete"}]
-        )
-        mock_mgr._crud.async_delete_trip = AsyncMock()
+        mock_mgr._crud.async_replace_recurring_trips = AsyncMock()
+        mock_mgr._crud.async_add_recurring_trips = AsyncMock()
 
         handler = make_import_weekly_pattern_handler(mock_hass)
         call = _make_service_call(
@@ -408,7 +438,8 @@ class TestMakeImportWeeklyPatternHandler:
         await handler(call)
 
         # Should default to clearing existing
-        mock_mgr._crud.async_delete_trip.assert_called_once_with("should_delete")
+        mock_mgr._crud.async_replace_recurring_trips.assert_called_once_with([])
+        mock_mgr._crud.async_add_recurring_trips.assert_not_called()
 
 
 class TestMakeAddPunctualHandler:
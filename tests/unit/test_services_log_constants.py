@@ -483,8 +483,6 @@ class TestHandlerFactoriesLogConstants:
             _LOG_FIRST_PUNCTUAL,
             _LOG_FIRST_RECURRING,
             _LOG_FOUND_TRIP,
-            _LOG_FOUND_TRIPS_COUNT,
-            _LOG_GETTING_ALL_TO_FIND,
             _LOG_GETTING_PUNCTUAL,
             _LOG_GETTING_RECURRING,
             _LOG_GOT_PUNCTUAL,
@@ -502,7 +500,6 @@ class TestHandlerFactoriesLogConstants:
             _LOG_RECURRING_TRIPS_BEFORE,
             _LOG_REFRESH,
             _LOG_RETRIEVED,
-            _LOG_SEARCHING_FOR_ID,
             _LOG_TOTAL_COUNT,
             _LOG_TRIP_GET_NOT_FOUND,
             _LOG_TRIP_GET_SERVICE_CALLED,
@@ -546,9 +543,6 @@ class TestHandlerFactoriesLogConstants:
                 ("_LOG_TRIP_GET_SERVICE_CALLED", _LOG_TRIP_GET_SERVICE_CALLED),
                 ("_LOG_TRIP_GET_SUCCESS", _LOG_TRIP_GET_SUCCESS),
                 ("_LOG_TRIP_GET_NOT_FOUND", _LOG_TRIP_GET_NOT_FOUND),
-                ("_LOG_GETTING_ALL_TO_FIND", _LOG_GETTING_ALL_TO_FIND),
-                ("_LOG_FOUND_TRIPS_COUNT", _LOG_FOUND_TRIPS_COUNT),
-                ("_LOG_SEARCHING_FOR_ID", _LOG_SEARCHING_FOR_ID),
                 ("_LOG_FOUND_TRIP", _LOG_FOUND_TRIP),
                 ("_LOG_ERROR_GETTING_TRIP", _LOG_ERROR_GETTING_TRIP),
                 ("_LOG_FINDING_ALL_TO_FIND_ID", _LOG_FINDING_ALL_TO_FIND_ID),
@@ -699,26 +693,6 @@ class TestHandlerFactoriesLogConstants:
         assert "My Car" in result
         assert "trip_1" in result
 
-    def test_found_trips_count_format(self):
-        """_LOG_FOUND_TRIPS_COUNT has two %d placeholders."""
-        from custom_components.ev_trip_planner.services._handler_factories import (
-            _LOG_FOUND_TRIPS_COUNT,
-        )
-
-        result = _LOG_FOUND_TRIPS_COUNT % (3, 1)
-        assert "3" in result
-        assert "1" in result
-
-    def test_searching_for_id_format(self):
-        """_LOG_SEARCHING_FOR_ID has two placeholders."""
-        from custom_components.ev_trip_planner.services._handler_factories import (
-            _LOG_SEARCHING_FOR_ID,
-        )
-
-        result = _LOG_SEARCHING_FOR_ID % (4, "trip_1")
-        assert "4" in result
-        assert "trip_1" in result
-
     def test_error_getting_trip_format(self):
         """_LOG_ERROR_GETTING_TRIP has three placeholders."""
         from custom_components.ev_trip_planner.services._handler_factories import (
@@ -83,6 +83,24 @@ class TestRegisterServicesCalls:
         assert "dia_semana" in str(schema)
         assert "hora" in str(schema)
 
+    def test_schemas_reused_across_registrations(self):
+        """Schemas are module constants, not rebuilt per register_services call."""
+        from custom_components.ev_trip_planner.services import register_services
+
+        schemas = []
+        for _ in range(2):
+            hass = MagicMock()
+            register_services(hass)
+            schemas.append(
+                {
+                    c[0][1]: c[1]["schema"]
+                    for c in hass.services.async_register.call_args_list
+                }
+            )
+
+        first, second = schemas
+        assert all(first[name] is second[name] for name in first)
+
     def test_trip_list_has_supports_response(self, mock_hass):
         """Kill mutations: supports_response=None → supports_response.ONLY (or vice versa)."""
         from homeassistant.core import SupportsResponse
@@ -14,7 +14,6 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from custom_components.ev_trip_planner.services._utils import (
-    _ensure_setup,
     _find_entry_by_vehicle,
     _get_coordinator,
     _get_manager,
@@ -214,17 +213,3 @@ class TestGetCoordinatorBehavior:
         result = _get_coordinator(hass, "vehicle1")
 
         assert result is coord
-
-
-class TestEnsureSetupNoop:
-    """Targets mutation survivors in _ensure_setup."""
-
-    @pytest.mark.asyncio
-    async def test_is_noop(self):
-        """Kill mutations: pass → raise or do something."""
-        mgr = MagicMock()
-
-        await _ensure_setup(mgr)
-
-        # No calls should be made — it's a pass statement
-        mgr.assert_not_called()
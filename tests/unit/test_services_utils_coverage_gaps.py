@@ -8,7 +8,6 @@ from unittest.mock import MagicMock
 import pytest
 
 from custom_components.ev_trip_planner.services._utils import (
-    _ensure_setup,
     _find_entry_by_vehicle,
     _get_coordinator,
     _get_manager,
@@ -83,12 +82,6 @@ class TestGetManager:
             await _get_manager(hass, "unknown_vehicle")
         assert "unknown_vehicle" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_ensure_setup_is_noop(self):
-        """Line 142: _ensure_setup is a no-op pass."""
-        mgr = MagicMock()
-        await _ensure_setup(mgr)  # Should not raise
-
 
 class TestBuildPresenceConfig:
     """Test build_presence_config (lines 145-167)."""
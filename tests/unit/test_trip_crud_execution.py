@@ -205,6 +205,21 @@ class TestCRUDUpdate:
         await tm._crud.async_update_trip("nonexistent", {"km": 10.0})
         tm._state.async_save_trips.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_update_with_unchanged_values_skips_save_and_sync(self):
+        """An update that changes nothing neither saves nor syncs EMHASS."""
+        tm = _make_tm(recurring={"rec_1": {"id": "rec_1", "km": 50.0, "activo": True}})
+        sync_mock = AsyncMock()
+        tm._state._emhass_sync._async_sync_trip_to_emhass = sync_mock
+        await tm._crud.async_update_trip("rec_1", {"km": 50.0, "unknown": "x"})
+        assert tm._state.recurring_trips["rec_1"] == {
+            "id": "rec_1",
+            "km": 50.0,
+            "activo": True,
+        }
+        tm._state.async_save_trips.assert_not_called()
+        sync_mock.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_update_recurring_triggers_emhass_sync(self):
         """Update to recurring trip triggers EMHASS sync."""
@@ -301,6 +316,21 @@ class TestCRUDPauseResume:
         assert tm._state.recurring_trips["rec_1"]["activo"] is True
         tm._state.async_save_trips.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_pause_already_paused_trip_skips_save(self):
+        """Pausing a trip that is already paused does not save."""
+        tm = _make_tm(recurring={"rec_1": {"id": "rec_1", "activo": False}})
+        await tm._lifecycle.async_pause_recurring_trip("rec_1")
+        assert tm._state.recurring_trips["rec_1"]["activo"] is False
+        tm._state.async_save_trips.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resume_already_active_trip_skips_save(self):
+        """Resuming a trip that is already active does not save."""
+        tm = _make_tm(recurring={"rec_1": {"id": "rec_1", "activo": True}})
+        await tm._lifecycle.async_resume_recurring_trip("rec_1")
+        tm._state.async_save_trips.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_resume_nonexistent_trip(self):
         """Resuming non-existent trip logs warning, no save."""
@@ -320,6 +350,13 @@ class TestCRUDCompleteCancel:
         assert tm._state.punctual_trips["pun_1"]["estado"] == "completado"
         tm._state.async_save_trips.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_complete_already_completed_trip_skips_save(self):
+        """Completing an already completed trip does not save."""
+        tm = _make_tm(punctual={"pun_1": {"id": "pun_1", "estado": "completado"}})
+        await tm._lifecycle.async_complete_punctual_trip("pun_1")
+        tm._state.async_save_trips.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_complete_nonexistent_trip(self):
         """Completing non-existent trip does nothing."""
@@ -137,6 +137,11 @@ class TestPunctualTripIds:
         trip_id = generate_trip_id("punctual", "20251119")
         assert trip_id.startswith("pun_20251119_")
 
+    def test_punctual_ymd_string_kept_verbatim(self):
+        """YYYYMMDD strings are used as-is, even if not a calendar date."""
+        trip_id = generate_trip_id("punctual", "20251399")
+        assert trip_id.startswith("pun_20251399_")
+
     def test_punctual_date_object(self):
         """Test punctual trip ID with date object."""
         trip_id = generate_trip_id("punctual", date(2025, 11, 19))
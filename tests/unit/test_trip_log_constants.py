@@ -69,12 +69,12 @@ class TestTripCRUDLogConstants:
 class TestTripPersistenceLogConstants:
     """Assert values of log format string constants in _persistence.py."""
 
-    def test_log_setup_info_format(self):
+    def test_log_setup_debug_format(self):
         _persistence = pytest.importorskip(
             "custom_components.ev_trip_planner.trip._persistence"
         )
         assert (
-            _persistence._LOG_SETUP_INFO
+            _persistence._LOG_SETUP_DEBUG
             == "Configurando gestor de viajes para vehículo: %s"
         )
 
@@ -179,6 +179,18 @@ class TestTripManagerMethods:
         assert tm._state.recurring_trips == {}
         assert tm._state.punctual_trips == {}
 
+    @pytest.mark.asyncio
+    async def test_load_trips_reads_storage_once_when_empty(self):
+        """An empty store is read once; later _load_trips calls stay in memory."""
+        tm = _make_tm()
+        tm._state._trips = {}
+        tm._state.recurring_trips = {}
+        tm._state.punctual_trips = {}
+        tm._state.storage.async_load = AsyncMock(return_value=None)
+        await tm._persistence._load_trips()
+        await tm._persistence._load_trips()
+        tm._state.storage.async_load.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_save_trips_exception(self):
         """Exception during save triggers exception logging (lines 79-80)."""
@@ -187,6 +199,27 @@ class TestTripManagerMethods:
         await tm._persistence.async_save_trips()
         # Should not raise; exception path handled
 
+    @pytest.mark.asyncio
+    async def test_save_trips_notifies_listeners(self):
+        """Registered listeners fire after each save until removed."""
+        tm = _make_tm()
+        listener = MagicMock()
+        remove = tm.register_listener(listener)
+        await tm._persistence.async_save_trips()
+        listener.assert_called_once_with()
+        remove()
+        await tm._persistence.async_save_trips()
+        listener.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_save_trips_invalidates_read_caches(self):
+        """A save drops memoized views so in-place edits are picked up."""
+        tm = _make_tm()
+        tm._state.recurring_by_weekday()
+        assert tm._state._weekday_index is not None
+        await tm._persistence.async_save_trips()
+        assert tm._state._weekday_index is None
+
     @pytest.mark.asyncio
     async def test_get_next_trip_via_navigator(self):
         """Next trip via TripNavigator finds pending punctual trip."""
@@ -18,7 +18,7 @@ of each module's public API.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -261,6 +261,78 @@ class TestCRUDMixin:
         assert len(result) == 1
         assert result[0]["id"] == "p1"
 
+    async def test_async_get_trip_by_id(self, mock_hass):
+        tm = _make_tm(mock_hass)
+        tm._state.recurring_trips = {"r1": {"id": "r1", "dia_semana": "lunes"}}
+        tm._state.punctual_trips = {"p1": {"id": "p1"}}
+        assert await tm._crud.async_get_trip("r1") is tm._state.recurring_trips["r1"]
+        assert await tm._crud.async_get_trip("p1") is tm._state.punctual_trips["p1"]
+        assert await tm._crud.async_get_trip("missing") is None
+
+    async def test_trip_lists_memoized_until_invalidated(self, mock_hass):
+        """Repeated reads reuse the list; adds, deletes and reloads rebuild it."""
+        tm = _make_tm(mock_hass)
+        tm._state.recurring_trips = {"r1": {"id": "r1", "dia_semana": "lunes"}}
+        first = await tm._crud.async_get_recurring_trips()
+        assert await tm._crud.async_get_recurring_trips() is first
+
+        tm._state.recurring_trips["r2"] = {"id": "r2", "dia_semana": "martes"}
+        tm._state.invalidate_trip_lists()
+        second = await tm._crud.async_get_recurring_trips()
+        assert second is not first
+        assert len(second) == 2
+
+        tm._state.recurring_trips = {}
+        assert len(await tm._crud.async_get_recurring_trips()) == 0
+
+    async def test_trip_lists_cannot_be_mutated_by_callers(self, mock_hass):
+        """A caller editing its result cannot change what the next call sees."""
+        tm = _make_tm(mock_hass)
+        tm._state.punctual_trips = {"p1": {"id": "p1"}}
+        first = list(await tm._crud.async_get_punctual_trips())
+        first.append({"id": "intruder"})
+        with pytest.raises(AttributeError):
+            (await tm._crud.async_get_punctual_trips()).append({"id": "intruder"})
+
+        assert [t["id"] for t in await tm._crud.async_get_punctual_trips()] == ["p1"]
+
+    async def test_recurring_by_weekday_buckets_active_trips(self, mock_hass):
+        """Active recurring trips are indexed by weekday; pause rebuilds on save."""
+        tm = _make_tm(mock_hass)
+        tm._state.recurring_trips = {
+            "r1": {
+                "id": "r1",
+                "tipo": "recurrente",
+                "dia_semana": "lunes",
+                "activo": True,
+            },
+            "r2": {
+                "id": "r2",
+                "tipo": "recurrente",
+                "dia_semana": "friday",
+                "activo": True,
+            },
+            "r3": {
+                "id": "r3",
+                "tipo": "recurrente",
+                "dia_semana": "lunes",
+                "activo": False,
+            },
+            "r4": {"id": "r4", "tipo": "recurrente", "dia": "Domingo"},
+            "r5": {"id": "r5", "tipo": "recurrente", "dia_semana": "funday"},
+            "r6": {"id": "r6", "tipo": "puntual", "dia_semana": "lunes"},
+        }
+        buckets = tm._state.recurring_by_weekday()
+        assert [t["id"] for t in buckets[0]] == ["r1"]
+        assert [t["id"] for t in buckets[4]] == ["r2"]
+        assert [t["id"] for t in buckets[6]] == ["r4"]
+        assert sum(len(bucket) for bucket in buckets) == 3
+        assert tm._state.recurring_by_weekday() is buckets
+
+        tm._state.recurring_trips["r1"]["activo"] = False
+        tm._state.invalidate_trip_lists()
+        assert tm._state.recurring_by_weekday()[0] == []
+
     async def test_async_add_recurring_trip(self, mock_hass):
         """Adding a recurring trip stores it and saves."""
         saved_data = {}
@@ -302,6 +374,74 @@ class TestCRUDMixin:
         assert trip["dia_semana"] == "miercoles"
         assert trip["activo"] is True
 
+    async def test_async_add_recurring_trips_saves_once(self, mock_hass):
+        """Bulk add stores every trip with a single storage write."""
+        storage = MagicMock(spec=YamlTripStorage)
+        storage.async_save = AsyncMock()
+        storage.load_recurring = MagicMock(return_value={})
+        storage.load_punctual = MagicMock(return_value={})
+
+        tm = _make_tm(mock_hass, storage=storage, emhass_adapter=None)
+
+        await tm._crud.async_add_recurring_trips(
+            [
+                {"dia_semana": "lunes", "hora": "08:00", "km": 10.0, "kwh": 1.5},
+                {"dia_semana": "martes", "hora": "09:00", "km": 20.0, "kwh": 3.0},
+            ]
+        )
+        assert len(tm._state.recurring_trips) == 2
+        storage.async_save.assert_awaited_once()
+
+    async def test_async_add_recurring_trips_invalid_entry_stores_nothing(
+        self, mock_hass
+    ):
+        """An invalid hora aborts the batch before anything is stored."""
+        storage = MagicMock(spec=YamlTripStorage)
+        storage.async_save = AsyncMock()
+        storage.load_recurring = MagicMock(return_value={})
+        storage.load_punctual = MagicMock(return_value={})
+
+        tm = _make_tm(mock_hass, storage=storage, emhass_adapter=None)
+
+        with pytest.raises(ValueError):
+            await tm._crud.async_add_recurring_trips(
+                [
+                    {"dia_semana": "lunes", "hora": "08:00", "km": 10.0, "kwh": 1.5},
+                    {"dia_semana": "martes", "hora": "25:99", "km": 20.0, "kwh": 3.0},
+                ]
+            )
+        assert tm._state.recurring_trips == {}
+        storage.async_save.assert_not_awaited()
+
+    async def test_async_replace_recurring_trips(self, mock_hass):
+        """Replace swaps the recurring set, keeps punctual trips, saves once."""
+        storage = MagicMock(spec=YamlTripStorage)
+        storage.async_save = AsyncMock()
+        storage.load_recurring = MagicMock(return_value={})
+        storage.load_punctual = MagicMock(return_value={})
+
+        tm = _make_tm(mock_hass, storage=storage, emhass_adapter=None)
+        tm._state.recurring_trips = {"old_1": {"id": "old_1"}, "old_2": {"id": "old_2"}}
+        tm._state.punctual_trips = {"pun_1": {"id": "pun_1"}}
+
+        await tm._crud.async_replace_recurring_trips(
+            [
+                {
+                    "trip_id": "new_1",
+                    "dia_semana": "lunes",
+                    "hora": "08:00",
+                    "km": 10.0,
+                    "kwh": 1.5,
+                }
+            ]
+        )
+        assert list(tm._state.recurring_trips) == ["new_1"]
+        assert list(tm._state.punctual_trips) == ["pun_1"]
+        assert [t["id"] for t in await tm._crud.async_get_recurring_trips()] == [
+            "new_1"
+        ]
+        storage.async_save.assert_awaited_once()
+
     async def test_async_add_punctual_trip(self, mock_hass):
         storage = MagicMock(spec=YamlTripStorage)
         storage.async_save = AsyncMock()
@@ -861,6 +1001,29 @@ class TestTripManagerPublicMethods:
         result = await tm._navigator.async_get_next_trip()
         assert result is None
 
+    async def test_async_get_next_trip_picks_earliest_across_types(self, mock_hass):
+        tm = _make_tm(mock_hass)
+        tm._state.punctual_trips = {
+            "p_late": {
+                "id": "p_late",
+                "tipo": "puntual",
+                "datetime": "2099-05-12T08:00:00",
+                "km": 10,
+                "kwh": 1,
+                "estado": "pendiente",
+            },
+            "p_early": {
+                "id": "p_early",
+                "tipo": "puntual",
+                "datetime": "2099-05-11T08:00:00",
+                "km": 10,
+                "kwh": 1,
+                "estado": "pendiente",
+            },
+        }
+        result = await tm._navigator.async_get_next_trip()
+        assert result["id"] == "p_early"
+
     async def test_async_get_next_trip_after_no_matches(self, mock_hass):
         tm = _make_tm(mock_hass)
         tm._state.punctual_trips = {
@@ -914,6 +1077,23 @@ class TestTripManagerPublicMethods:
         result = tm._state._soc._get_trip_time(trip)
         assert result is not None
 
+    async def test_get_trip_time_punctual_parsed_once_per_trip_set(self, mock_hass):
+        """Punctual times are memoized until the trip set changes."""
+        tm = _make_tm(mock_hass)
+        trip = {"tipo": "puntual", "datetime": "2026-06-15T14:00:00"}
+        with patch(
+            "custom_components.ev_trip_planner.trip._soc_helpers.calculate_trip_time",
+            return_value=datetime(2026, 6, 15, 14, 0),
+        ) as calc:
+            first = tm._state._soc._get_trip_time(trip)
+            assert tm._state._soc._get_trip_time(trip) is first
+            assert calc.call_count == 1
+
+            tm._state.invalidate_trip_lists()
+            tm._state._soc._get_trip_time(trip)
+            assert calc.call_count == 2
+        assert first == datetime(2026, 6, 15, 14, 0, tzinfo=timezone.utc)
+
     async def test_get_trip_time_missing_tipo(self, mock_hass):
         tm = _make_tm(mock_hass)
         trip = {"descripcion": "no type"}
@@ -281,6 +281,18 @@ class TestScheduleMixinExecution:
 
         adapter.async_publish_all_deferrable_loads.assert_called_once_with(trips)
 
+    @pytest.mark.asyncio
+    async def test_publish_deferrable_loads_notifies_listeners(self):
+        """A successful publish fires the trip listeners (coordinator refresh)."""
+        sm = _make_sm()
+        adapter = MagicMock()
+        adapter.async_publish_all_deferrable_loads = AsyncMock()
+        sm._state.emhass_adapter = adapter
+
+        await sm.publish_deferrable_loads(trips=[])
+
+        sm._state._persistence.notify_listeners.assert_called_once_with()
+
     @pytest.mark.asyncio
     async def test_publish_deferrable_loads_adapter_raises(self):
         """Adapter exception is logged, not propagated."""
@@ -293,6 +305,8 @@ class TestScheduleMixinExecution:
 
         await sm.publish_deferrable_loads()
 
+        sm._state._persistence.notify_listeners.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_publish_deferrable_loads_skips_inactive(self):
         """Inactive trips are not passed to adapter."""
@@ -351,6 +351,16 @@ class TestSOCQuery:
         result = await sq.async_get_hours_needed_today()
         assert result >= 3  # 10 kWh / 3.6 kW = ~3 hours
 
+    def test_hours_for_kwh_rounds_up(self):
+        """hours_for_kwh derives ceil(kwh / charging_power) without a trip scan."""
+        state = _make_state()
+        entry = MagicMock()
+        entry.data = {"charging_power_kw": 3.6, "vehicle_name": "test_vehicle"}
+        state.hass.config_entries.async_entries = MagicMock(return_value=[entry])
+        sq = SOCQuery(state)
+        assert sq.hours_for_kwh(10.0) == 3
+        assert sq.hours_for_kwh(0.0) == 0
+
     @pytest.mark.asyncio
     async def test_get_charging_power_from_entry(self):
         """_get_charging_power finds config entry with matching vehicle_name (lines 175-177)."""